@@ -2,7 +2,15 @@
 
 import os
 import sys
+import copy
 import json
+import time
+import queue
+import hashlib
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import is_dataclass, asdict
+from enum import Enum
 import networkx as nx
 from networkx.readwrite import json_graph
 from typing import Dict, List, Optional, Set, Any
@@ -14,7 +22,7 @@ from datetime import datetime
 try:
     from regex_components.ConfigFileParser import ConfigFileParser
     from regex_components.DependencyMapper import DependencyMapper
-    from regex_components.CodeIdentifierExtractor import CodeIdentifierExtractor, MethodInfo, Parameter
+    from regex_components.CodeIdentifierExtractor import CodeIdentifierExtractor, MethodInfo, Parameter, strip_comments_and_strings
     from regex_components.CommentProcessor import CommentProcessor
     from regex_components.DocumentationAnalyzer import DocumentationAnalyzer
     from regex_components.BuildConfigExtractor import BuildConfigExtractor
@@ -29,20 +37,197 @@ except ImportError as e:
     print("Make sure all component files are in the 'regex_components' directory")
     sys.exit(1)
 
+# orjson serializes straight to UTF-8 bytes in C, several times faster
+# than stdlib json on big graphs; entirely optional
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+# Checked before hot-path logging.debug calls: even a dropped record
+# pays for its f-string, which adds up over millions of graph elements
+_DEBUG = logging.getLogger().isEnabledFor(logging.DEBUG)
+
+
+# Minimum number of Java files before a process pool pays for itself
+_MIN_PARALLEL_FILES = 8
+
+# Bounded depth of the serial-path read-ahead queue
+_PREFETCH_DEPTH = 64
+
+# Output order of the metadata stats block; set-valued counters are
+# reported as their cardinality
+_STAT_KEYS = (
+    "total_files",
+    "files_processed",
+    "files_with_errors",
+    "total_classes",
+    "total_interfaces",
+    "total_enums",
+    "total_methods",
+    "total_packages",
+    "total_imports",
+    "total_dependencies",
+    "total_annotations",
+    "total_api_endpoints",
+    "total_logging_statements",
+    "total_comments",
+    "total_configs",
+    "total_integrations",
+    "total_localizations",
+    "total_build_scripts",
+    "total_version_constraints",
+)
+
+# Shape of the saved document, kept in one place so repeated saves and
+# the example generator stop rebuilding an 80-entry literal per call
+_EXAMPLE_OUTPUT_TEMPLATE = {
+    "graph": {
+        "directed": True,
+        "multigraph": False,
+        "nodes": [],
+        "links": []
+    },
+    "metadata": {
+        "stats": dict.fromkeys(_STAT_KEYS, 0),
+        "build_info": {
+            "java_version": "",
+            "build_tool": "",
+            "main_class": ""
+        },
+        "documentation": {
+            "readme_path": "",
+            "api_docs": "",
+            "coverage_threshold": 0
+        },
+        "analysis_timestamp": "",
+        "analyzed_directory": "",
+        "packages": [],
+        "dependencies": []
+    }
+}
+
+# File name of the on-disk parse cache kept in the analyzed directory
+_PARSE_CACHE_NAME = '.cntxtjv_cache'
+
+# Classification tables: one set lookup per file replaces the cascade of
+# endswith/startswith checks in the dispatch loop
+_BUILD_FILES = frozenset({'pom.xml', 'build.gradle'})
+_CONFIG_EXTS = frozenset({'.ini', '.env', '.yml', '.yaml', '.properties', '.json'})
+_DOC_FILES = frozenset({'readme.md', 'api.md', 'docs.md'})
+
+
+def _classify_file(file_name: str) -> str:
+    """Classify a file name into its processing kind.
+
+    Mirrors the historical dispatch order: config extensions are tested
+    before the messages_*.properties check, so localization bundles keep
+    routing through the config processor.
+    """
+    if file_name.endswith('.java'):
+        return 'java'
+    if file_name in _BUILD_FILES:
+        return 'build'
+    # splitext returns no extension for dotfiles like '.env'; fall back
+    # to the full name so they still classify by suffix
+    ext = os.path.splitext(file_name)[1] or file_name
+    if ext in _CONFIG_EXTS:
+        return 'config'
+    if file_name.startswith('messages_') and file_name.endswith('.properties'):
+        return 'localization'
+    if file_name.lower() in _DOC_FILES:
+        return 'doc'
+    return 'other'
+
+class _GraphJSONEncoder(json.JSONEncoder):
+    """Serializes the dataclasses kept as node attributes.
+
+    Nodes store extractor results (MethodInfo, Parameter,
+    VersionConstraint) as-is instead of rebuilding them as dicts during
+    ingest; the conversion happens once here, at dump time.
+    """
+
+    def default(self, o):
+        if is_dataclass(o) and not isinstance(o, type):
+            return asdict(o)
+        if isinstance(o, Enum):
+            return o.value
+        return super().default(o)
+
+
+# Per-process analyzer reused by pool workers
+_worker_analyzer = None
+
+
+def _init_java_worker(directory: str):
+    """Initialize a pool worker with its own analyzer instance."""
+    global _worker_analyzer
+    _worker_analyzer = JavaCodeKnowledgeGraph(directory)
+
+
+def _analyze_java_file_task(file_path: str):
+    """Analyze one Java file in a pool worker, returning plain data.
+
+    The worker's staging buffers are reset per file so each result is an
+    independent (nodes, edges, errors) triple the parent can merge; the
+    worker never materializes a graph of its own.
+    """
+    analyzer = _worker_analyzer
+    analyzer._known_nodes.clear()
+    analyzer._nodes_buf = {}
+    analyzer._edges_buf = []
+    analyzer.stats['files_with_errors'] = 0
+    analyzer._analyze_java_file(file_path)
+    return analyzer._nodes_buf, analyzer._edges_buf, analyzer.stats['files_with_errors']
+
 
 class JavaCodeKnowledgeGraph:
-    def __init__(self, directory: str):
+    # Maps node types to the scalar counters they feed when merging
+    # parallel worker results
+    _NODE_TYPE_COUNTERS = {
+        'class': 'total_classes',
+        'interface': 'total_interfaces',
+        'enum': 'total_enums',
+        'method': 'total_methods',
+        'import': 'total_imports',
+        'comment': 'total_comments',
+        'log_statement': 'total_logging_statements',
+        'api_integration': 'total_integrations',
+        'version': 'total_version_constraints',
+        'localization': 'total_localizations'
+    }
+
+    def __init__(self, directory: str, jobs: Optional[int] = None):
         """Initialize the knowledge graph generator."""
-        self.directory = directory
+        self.directory = os.path.normpath(directory)
+        # Every walked path starts with the root plus a separator, so
+        # relative paths are a constant-time prefix strip (see _rel)
+        self._dir_prefix_len = len(self.directory) + 1
+        self.jobs = jobs
         self.graph = nx.DiGraph()
         self.files_processed = 0
         self.total_files = 0
         self.dirs_processed = 0
         self.analyzed_files = set()
         self.class_map = {}
+        self._last_print = 0.0
+
+        # Per-file staging buffers; nodes/edges are flushed to the graph in
+        # bulk once per file instead of one networkx call per element
+        self._known_nodes: Set[str] = set()
+        self._nodes_buf: Dict[str, dict] = {}
+        self._edges_buf: List[tuple] = []
+
+        # On-disk parse cache: content key -> (nodes, edges, errors)
+        # record for one Java file, replayed on later runs when the file
+        # is unchanged. Only entries touched this run are written back,
+        # so stale entries for deleted files age out automatically.
+        self._cache_path = os.path.join(self.directory, _PARSE_CACHE_NAME)
+        self._parse_cache: Dict[str, tuple] = {}
+        self._fresh_cache: Dict[str, tuple] = {}
 
         # Initialize statistics
         self.stats = {
@@ -97,124 +282,398 @@ class JavaCodeKnowledgeGraph:
         }
 
         self.ignored_files = {
-            '.gitignore', '.classpath', '.project', '.DS_Store'
+            '.gitignore', '.classpath', '.project', '.DS_Store',
+            _PARSE_CACHE_NAME
         }
 
+    def _buffer_node(self, node_id: str, **attrs) -> bool:
+        """Stage a node for bulk insertion; returns True if it is new."""
+        if node_id in self._known_nodes or self.graph.has_node(node_id):
+            return False
+        self._known_nodes.add(node_id)
+        self._nodes_buf[node_id] = attrs
+        return True
+
+    def _buffer_edge(self, source: str, target: str, relation: str):
+        """Stage an edge for bulk insertion.
+
+        Relation labels come from a small closed set repeated across
+        every edge; interning them here makes each attribute dict share
+        one string object and turns later equality checks into pointer
+        compares.
+        """
+        self._edges_buf.append((source, target, {'relation': sys.intern(relation)}))
+
+    def _flush_graph_buffers(self):
+        """Flush staged nodes and edges into the graph in bulk."""
+        if self._nodes_buf:
+            self.graph.add_nodes_from(self._nodes_buf.items())
+            self._nodes_buf = {}
+        if self._edges_buf:
+            self.graph.add_edges_from(self._edges_buf)
+            self._edges_buf = []
+
+    def _content_key(self, file_path: str, raw: bytes) -> str:
+        """Cache key for one file: relative path, size and a content hash.
+
+        The cached records carry path-dependent data (the File: node,
+        package-membership edges), so the path has to be part of the
+        key — on content alone, two identical files would collapse to
+        one entry and a warm run would drop all but one of them.
+        """
+        digest = hashlib.blake2b(raw, digest_size=16).hexdigest()
+        return f"{self._rel(file_path)}:{len(raw)}:{digest}"
+
+    @staticmethod
+    def _stable_hash(text: str) -> str:
+        """Short deterministic digest for content-derived node ids.
+
+        The builtin hash() is salted per interpreter run, which made
+        comment and log ids differ between otherwise identical runs.
+        """
+        return hashlib.blake2b(text.encode('utf-8'), digest_size=8).hexdigest()
+
+    def _load_parse_cache(self):
+        """Load the parse cache from a previous run, if any.
+
+        The cache lives inside the analyzed tree, which may be an
+        untrusted codebase, so it is plain JSON: a crafted cache file
+        can at worst produce garbage entries, never code execution the
+        way unpickling would. Records come back as [nodes, edges,
+        errors] lists with dict attrs — the same shapes the merge and
+        the JSON encoder already handle.
+        """
+        try:
+            with open(self._cache_path, 'r', encoding='utf-8') as f:
+                self._parse_cache = json.load(f)
+            logging.debug(f"Loaded parse cache with {len(self._parse_cache)} entries")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logging.warning(f"Ignoring unreadable parse cache {self._cache_path}: {str(e)}")
+            self._parse_cache = {}
+
+    def _save_parse_cache(self):
+        """Persist the entries touched during this run."""
+        if not self._fresh_cache and not self._parse_cache:
+            return
+        try:
+            with open(self._cache_path, 'w', encoding='utf-8') as f:
+                json.dump(self._fresh_cache, f, cls=_GraphJSONEncoder)
+        except Exception as e:
+            logging.warning(f"Could not write parse cache {self._cache_path}: {str(e)}")
+
+    def _replay_cached_record(self, file_path: str, key: str, record: tuple):
+        """Merge a cached per-file record instead of re-parsing the file."""
+        self.files_processed += 1
+        self._report_progress()
+        self.analyzed_files.add(file_path)
+        self._fresh_cache[key] = record
+        self._merge_file_result(*record)
+
+    def _capture_java_file(self, file_path: str, content: Optional[str] = None) -> tuple:
+        """Analyze one Java file in isolated buffers and return its record.
+
+        The record has the same (nodes, edges, errors) shape a pool
+        worker returns, so it can be merged with _merge_file_result and
+        stored in the parse cache. The analysis bumps the per-type
+        counters directly; those increments are rolled back here because
+        the merge recomputes them from the node attributes.
+        """
+        outer_buffers = (self._known_nodes, self._nodes_buf, self._edges_buf)
+        counters = {name: self.stats[name] for name in self._NODE_TYPE_COUNTERS.values()}
+        errors_before = self.stats['files_with_errors']
+        self._known_nodes, self._nodes_buf, self._edges_buf = set(), {}, []
+        try:
+            self._analyze_java_file(file_path, content)
+            record = (self._nodes_buf, self._edges_buf,
+                      self.stats['files_with_errors'] - errors_before)
+        finally:
+            self._known_nodes, self._nodes_buf, self._edges_buf = outer_buffers
+        self.stats.update(counters)
+        self.stats['files_with_errors'] = errors_before
+        return record
+
     def _add_dependency_node(self, build_node: str, dep_info: Dict[str, str]):
         """Add a dependency node to the graph."""
         dep_id = f"{dep_info['group_id']}:{dep_info['artifact_id']}"
         dep_node = f"Dependency: {dep_id}"
-        if not self.graph.has_node(dep_node):
-            self.graph.add_node(
-                dep_node,
-                type="dependency",
-                group_id=dep_info['group_id'],
-                artifact_id=dep_info['artifact_id'],
-                version=dep_info.get('version', ''),
-                scope=dep_info.get('scope', 'compile'),
-                id=dep_node
-            )
+        if self._buffer_node(
+            dep_node,
+            type="dependency",
+            group_id=dep_info['group_id'],
+            artifact_id=dep_info['artifact_id'],
+            version=dep_info.get('version', ''),
+            scope=dep_info.get('scope', 'compile'),
+            id=dep_node
+        ):
             self.stats['total_dependencies'].add(dep_id)
-        self.graph.add_edge(build_node, dep_node, relation="DEPENDS_ON")
+        self._buffer_edge(build_node, dep_node, "DEPENDS_ON")
 
     def analyze_codebase(self):
         """Analyze the Java codebase and build the knowledge graph."""
         logging.info("Starting codebase analysis...")
 
-        # Count files first
-        self._count_files()
+        self._load_parse_cache()
 
-        # Process the codebase
+        # Process the codebase (a single scandir traversal counts and
+        # collects the files as it goes)
         self._process_codebase()
 
+        self._save_parse_cache()
+
+        # Materialize the staged nodes and edges into the DiGraph in one
+        # bulk ingest; building it incrementally made networkx update its
+        # mirrored succ/pred dicts on every call
+        self._flush_graph_buffers()
+
         logging.info(f"Completed analysis of {self.files_processed} files")
         if self.stats['files_with_errors'] > 0:
             logging.warning(f"Encountered errors in {self.stats['files_with_errors']} files")
 
-    def _count_files(self):
-        """Count total files to be processed."""
-        for root, dirs, files in os.walk(self.directory):
-            dirs[:] = [d for d in dirs if d not in self.ignored_directories]
+    def _report_progress(self, force: bool = False):
+        """Print a rolling progress counter, throttled to ~20 Hz.
 
-            if not any(ignored in root.split(os.sep) for ignored in self.ignored_directories):
-                self.total_files += sum(
-                    1 for f in files
-                    if f.endswith(".java") and f not in self.ignored_files
-                )
-                # Include build files
-                self.total_files += sum(
-                    1 for f in files
-                    if f in {"pom.xml", "build.gradle"} and f not in self.ignored_files
-                )
-                # Include config files
-                self.total_files += sum(
-                    1 for f in files
-                    if f.endswith((".ini", ".env", ".yml", ".yaml", ".properties", ".json")) and f not in self.ignored_files
-                )
-                # Include localization files
-                self.total_files += sum(
-                    1 for f in files
-                    if f.startswith("messages_") and f.endswith(".properties") and f not in self.ignored_files
-                )
-                # Include README and documentation files
-                self.total_files += sum(
-                    1 for f in files
-                    if f.lower() in {"readme.md", "api.md", "docs.md"} and f not in self.ignored_files
-                )
-
-        logging.info(f"Found {self.total_files} files to process")
+        An unthrottled per-file print costs a write syscall per update
+        and can dominate the run on large codebases; coalescing updates
+        keeps the console feeling live at negligible cost. Workers in
+        the process pool never know the total, so they stay silent.
+        """
+        if not self.total_files:
+            return
+        now = time.monotonic()
+        if not force and now - self._last_print < 0.05:
+            return
+        self._last_print = now
+        print(f"Processing files: {self.files_processed}/{self.total_files}", end="\r", flush=True)
+
+    def _rel(self, file_path: str) -> str:
+        """Path relative to the analysis root via a cached prefix strip.
+
+        os.path.relpath redoes normpath/commonpath work on every call;
+        every walked path extends self.directory, so stripping the root
+        prefix is enough. Paths from outside the root fall back to
+        relpath.
+        """
+        if file_path.startswith(self.directory):
+            return file_path[self._dir_prefix_len:]
+        return os.path.relpath(file_path, self.directory)
+
+    def _scan_files(self):
+        """Yield (file_path, file_name) for every non-ignored file.
+
+        Uses os.scandir with an explicit stack instead of os.walk, so the
+        directory-type information comes straight from the dirent without
+        an extra stat per entry, and ignored directories are pruned by a
+        set lookup on the entry name before they are ever descended into.
+        """
+        stack = [self.directory]
+        while stack:
+            current = stack.pop()
+            self.dirs_processed += 1
+            if _DEBUG:
+                logging.debug(f"Scanning directory [{self.dirs_processed}]: {current}")
+            try:
+                with os.scandir(current) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in self.ignored_directories:
+                                stack.append(entry.path)
+                        elif entry.name not in self.ignored_files:
+                            yield entry.path, entry.name
+            except OSError as e:
+                logging.error(f"Error scanning directory {current}: {str(e)}")
 
     def _process_codebase(self):
         """Process all files in the codebase."""
-        for root, dirs, files in os.walk(self.directory):
-            dirs[:] = [d for d in dirs if d not in self.ignored_directories]
+        # One scandir traversal both counts the files and collects them
+        # for processing; each entry is classified exactly once
+        entries = [(path, _classify_file(name)) for path, name in self._scan_files()]
+        self.total_files = sum(1 for _, kind in entries if kind != 'other')
+        logging.info(f"Found {self.total_files} files to process")
+
+        java_files = []
+        handlers = {
+            'build': self._process_build_file,
+            'config': self._process_config_file,
+            'localization': self._process_localization_file,
+            'doc': self._process_documentation_file,
+            'other': self._process_generic_file,
+        }
+
+        for file_path, kind in entries:
+            if kind == 'java':
+                java_files.append(file_path)
+            else:
+                handlers[kind](file_path)
 
-            if any(ignored in root.split(os.sep) for ignored in self.ignored_directories):
+        if java_files:
+            if self._use_parallel(len(java_files)):
+                self._process_java_files_parallel(java_files)
+            else:
+                self._process_java_files_serial(java_files)
+
+        if self.total_files:
+            # Always land the final count on its own line
+            self._report_progress(force=True)
+            print()
+
+    def _use_parallel(self, java_count: int) -> bool:
+        """Decide whether Java files should go through the process pool.
+
+        Only Java files are shipped to the pool, so only they count
+        against the threshold; config and doc files are handled in the
+        parent regardless.
+        """
+        if self.jobs is not None and self.jobs <= 1:
+            return False
+        return java_count >= _MIN_PARALLEL_FILES
+
+    def _process_java_files_serial(self, java_files: List[str]):
+        """Analyze Java files in-process with a read-ahead thread.
+
+        A producer thread keeps a bounded queue of decoded contents
+        topped up, so disk latency overlaps with regex work instead of
+        serializing against it. The queue bound caps memory at roughly
+        _PREFETCH_DEPTH files.
+        """
+        prefetched: 'queue.Queue' = queue.Queue(maxsize=_PREFETCH_DEPTH)
+
+        def _read_ahead():
+            # Hashing for the parse-cache key rides along in the reader
+            # thread, overlapped with the consumer's regex work
+            for path in java_files:
+                try:
+                    with open(path, 'rb') as f:
+                        raw = f.read()
+                    prefetched.put((path, self._content_key(path, raw), raw.decode('utf-8')))
+                except Exception as e:
+                    prefetched.put((path, None, e))
+
+        reader = threading.Thread(target=_read_ahead, daemon=True)
+        reader.start()
+
+        for _ in java_files:
+            path, key, payload = prefetched.get()
+            if isinstance(payload, Exception):
+                logging.error(f"Error processing {path}: {str(payload)}")
+                self.stats['files_with_errors'] += 1
+                continue
+            if path in self.analyzed_files:
+                continue
+            record = self._parse_cache.get(key)
+            if record is not None:
+                self._replay_cached_record(path, key, record)
                 continue
+            record = self._capture_java_file(path, payload)
+            self._merge_file_result(*record)
+            # Records from files that errored may be partial; leave them
+            # out so a later run retries the parse
+            if record[2] == 0:
+                self._fresh_cache[key] = record
+
+        reader.join()
+
+    def _process_java_files_parallel(self, java_files: List[str]):
+        """Analyze Java files in a process pool and merge the results.
+
+        Files whose content key hits the parse cache are replayed in the
+        parent; only the misses are shipped to the pool. Hashing reads
+        each file once up front, which is cheap next to the regex work
+        and leaves the bytes hot in the page cache for the worker.
+        """
+        pending = []
+        for file_path in java_files:
+            key = None
+            try:
+                with open(file_path, 'rb') as f:
+                    key = self._content_key(file_path, f.read())
+            except OSError:
+                # Let the worker surface the read error through the
+                # normal per-file error accounting
+                pass
+            record = self._parse_cache.get(key) if key else None
+            if record is not None:
+                self._replay_cached_record(file_path, key, record)
+            else:
+                pending.append((file_path, key))
 
-            rel_path = os.path.relpath(root, self.directory)
-            self.dirs_processed += 1
-            logging.debug(f"Processing directory [{self.dirs_processed}]: {rel_path}")
-
-            for file in files:
-                if file in self.ignored_files:
-                    continue
-
-                file_path = os.path.join(root, file)
-                relative_path = os.path.relpath(file_path, self.directory)
-
-                if file.endswith(".java"):
-                    self._process_java_file(file_path)
-                elif file in {"pom.xml", "build.gradle"}:
-                    self._process_build_file(file_path)
-                elif file.endswith((".ini", ".env", ".yml", ".yaml", ".properties", ".json")):
-                    self._process_config_file(file_path)
-                elif file.startswith("messages_") and file.endswith(".properties"):
-                    self._process_localization_file(file_path)
-                elif file.lower() in {"readme.md", "api.md", "docs.md"}:
-                    self._process_documentation_file(file_path)
-                else:
-                    self._process_generic_file(file_path)
+        if not pending:
+            return
+
+        workers = self.jobs or os.cpu_count()
+        logging.info(f"Analyzing {len(pending)} Java files with {workers} workers")
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_java_worker,
+            initargs=(self.directory,)
+        ) as executor:
+            for (file_path, key), result in zip(
+                pending,
+                executor.map(_analyze_java_file_task,
+                             [path for path, _ in pending], chunksize=32)
+            ):
+                self.files_processed += 1
+                self._report_progress()
+                self.analyzed_files.add(file_path)
+                self._merge_file_result(*result)
+                if key is not None and result[2] == 0:
+                    self._fresh_cache[key] = result
+
+    def _merge_file_result(self, nodes: Dict[str, dict], edges: List[tuple], errors: int):
+        """Merge one worker's (nodes, edges, errors) result into the graph.
+
+        Stats are recomputed from the node attributes during the merge so
+        that elements appearing in several files are only counted once,
+        exactly as in the serial path.
+        """
+        for node_id, attrs in nodes.items():
+            if not self._buffer_node(node_id, **attrs):
+                continue
+            node_type = attrs.get('type')
+            counter = self._NODE_TYPE_COUNTERS.get(node_type)
+            if counter:
+                self.stats[counter] += 1
+            elif node_type == 'package':
+                self.stats['total_packages'].add(attrs.get('name', ''))
+            elif node_type == 'annotation':
+                self.stats['total_annotations'].add(attrs.get('name', ''))
+        self._edges_buf.extend(edges)
+        self.stats['files_with_errors'] += errors
 
     def _process_java_file(self, file_path: str):
         """Process a single Java file."""
         if file_path in self.analyzed_files:
             return
+        self._analyze_java_file(file_path)
 
+    def _analyze_java_file(self, file_path: str, content: Optional[str] = None):
+        """Analyze a Java file into the staging buffers.
+
+        content may be supplied by a read-ahead stage; otherwise the
+        file is read here.
+        """
         try:
             self.files_processed += 1
-            relative_path = os.path.relpath(file_path, self.directory)
-            logging.debug(f"Processing file [{self.files_processed}/{self.total_files}]: {file_path}")
-
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            self._report_progress()
+            relative_path = self._rel(file_path)
+            if _DEBUG:
+                logging.debug(f"Processing file [{self.files_processed}/{self.total_files}]: {file_path}")
+
+            if content is None:
+                # Read raw bytes and decode in one shot; the incremental
+                # decoder of a text-mode file object is noticeably slower
+                # for whole-file reads
+                with open(file_path, 'rb') as f:
+                    content = f.read().decode('utf-8')
 
             # Add file node
             file_node = f"File: {relative_path}"
             self.analyzed_files.add(file_path)
-            self.graph.add_node(file_node, type="file", path=relative_path, encoding="UTF-8", fileType="SOURCE_CODE")
+            self._buffer_node(file_node, type="file", path=relative_path, encoding="UTF-8", fileType="SOURCE_CODE")
 
-            # Process file contents
+            # Process file contents; on failure the buffers keep whatever
+            # was staged before the error, so partial extractions survive
             self._process_file_contents(file_node, content, file_path)
 
         except Exception as e:
@@ -224,24 +683,34 @@ class JavaCodeKnowledgeGraph:
     def _process_file_contents(self, file_node: str, content: str, file_path: str):
         """Process the contents of a Java file using all analyzers."""
         try:
-            # Extract and process package
-            package_name = self.config_parser.extract_package(content)
+            # Structural extractors run on a copy with comments and string
+            # literals blanked; the original content is kept for extractors
+            # that need verbatim text (comments, logs, etc.)
+            code_content = strip_comments_and_strings(content)
+
+            # Extract package and imports in one declaration scan
+            package_name, imports = self.dependency_mapper.extract_declarations(code_content)
             if package_name:
                 self._add_package_node(file_node, package_name)
-
-            # Process imports
-            imports = self.dependency_mapper.extract_imports(content)
             for import_name in imports:
                 self._add_import_node(file_node, import_name)
 
-            # Process classes, interfaces, enums
-            classes = self.code_extractor.extract_classes(content)
+            # Process classes, interfaces, enums; a C-level substring test
+            # is far cheaper than the declaration regex, so files with no
+            # type keyword (package-info and the like) skip the scan
+            if ('class' in code_content or 'interface' in code_content
+                    or 'enum' in code_content):
+                classes = self.code_extractor.extract_classes(code_content)
+            else:
+                classes = []
+            if _DEBUG:
+                logging.debug(f"Extracted classes: {classes}")
             for class_info in classes:
                 class_name = class_info.name
-                class_type = str(class_info.type).capitalize()
-                self._add_class_node(file_node, class_name, class_type)
-                logging.debug(f"Extracted classes: {classes}")
-                logging.debug(f"Class extracted: {class_name} of type {class_type}")
+                class_type = class_info.type.value
+                class_node = self._add_class_node(file_node, class_name, class_type)
+                if _DEBUG:
+                    logging.debug(f"Class extracted: {class_name} of type {class_type}")
 
                 # Add class annotations
                 for annotation in class_info.annotations:
@@ -249,7 +718,7 @@ class JavaCodeKnowledgeGraph:
 
                 # Process methods within the class
                 for method in class_info.methods:
-                    self._add_method_node(class_name, method)
+                    self._add_method_node(class_node, method)
                     # Add method annotations
                     for annotation in method.annotations:
                         self._add_annotation_node(file_node, annotation)
@@ -285,180 +754,189 @@ class JavaCodeKnowledgeGraph:
 
     def _add_package_node(self, file_node: str, package_name: str):
         """Add a package node to the graph."""
+        # Every file of a package repeats the same name; intern it so the
+        # stats set and node attributes share one string object
+        package_name = sys.intern(package_name)
         package_node = f"Package: {package_name}"
-        if not self.graph.has_node(package_node):
-            self.graph.add_node(package_node, type="package", name=package_name, id=package_node)
+        if self._buffer_node(package_node, type="package", name=package_name, id=package_node):
             self.stats['total_packages'].add(package_name)
-        self.graph.add_edge(package_node, file_node, relation="CONTAINS_FILE")
+        self._buffer_edge(package_node, file_node, "CONTAINS_FILE")
 
     def _add_import_node(self, file_node: str, import_name: str):
         """Add an import node to the graph."""
+        # Common imports recur in most files of a codebase
+        import_name = sys.intern(import_name)
         import_node = f"Import: {import_name}"
-        if not self.graph.has_node(import_node):
-            self.graph.add_node(import_node, type="import", name=import_name, id=import_node)
+        if self._buffer_node(import_node, type="import", name=import_name, id=import_node):
             self.stats['total_imports'] += 1
-            logging.debug(f"Import added: {import_name}, Total imports: {self.stats['total_imports']}")
-        self.graph.add_edge(file_node, import_node, relation="IMPORTS")
-        logging.debug(f"Edge added: {file_node} -> {import_node} with relation IMPORTS")
-
-    def _add_class_node(self, file_node: str, class_name: str, class_type: str):
-        """Add a class node to the graph."""
-        class_type = class_type.strip().lower()
-        # Map Elementtype.class to class
-        if class_type == 'elementtype.class':
-            class_type = 'class'
-
+            if _DEBUG:
+                logging.debug(f"Import added: {import_name}, Total imports: {self.stats['total_imports']}")
+        self._buffer_edge(file_node, import_node, "IMPORTS")
+        if _DEBUG:
+            logging.debug(f"Edge added: {file_node} -> {import_node} with relation IMPORTS")
+
+    _CLASS_TYPE_COUNTERS = {
+        'class': 'total_classes',
+        'interface': 'total_interfaces',
+        'enum': 'total_enums'
+    }
+
+    def _add_class_node(self, file_node: str, class_name: str, class_type: str) -> str:
+        """Add a class node to the graph and return its node id.
+
+        The id is built once here and reused by the caller for every
+        method of the declaration rather than re-deriving it per member.
+        """
         class_node = f"{class_type.capitalize()}: {class_name}"
-        if not self.graph.has_node(class_node):
-            self.graph.add_node(class_node, type=class_type, name=class_name, id=class_node)
-            logging.debug(f"Class node added: {class_node} of type {class_type}")
+        if self._buffer_node(class_node, type=class_type, name=class_name, id=class_node):
+            if _DEBUG:
+                logging.debug(f"Class node added: {class_node} of type {class_type}")
 
             # Increment counters for classes, interfaces, enums
-            class_types = {'class': 'total_classes', 'interface': 'total_interfaces', 'enum': 'total_enums'}
-            if class_type in class_types:
-                self.stats[class_types[class_type]] += 1
-                logging.debug(f"Updated {class_types[class_type]} to {self.stats[class_types[class_type]]}")
+            counter = self._CLASS_TYPE_COUNTERS.get(class_type)
+            if counter:
+                self.stats[counter] += 1
+                if _DEBUG:
+                    logging.debug(f"Updated {counter} to {self.stats[counter]}")
             else:
                 logging.warning(f"Unknown class type: {class_type}")
         else:
-            logging.debug(f"Class node already exists: {class_node}")
-        
-        self.graph.add_edge(file_node, class_node, relation="DEFINES")
-        logging.debug(f"Edge added: {file_node} -> {class_node} with relation DEFINES")
+            if _DEBUG:
+                logging.debug(f"Class node already exists: {class_node}")
 
-    def _add_method_node(self, class_name: str, method_info: MethodInfo):
+        self._buffer_edge(file_node, class_node, "DEFINES")
+        if _DEBUG:
+            logging.debug(f"Edge added: {file_node} -> {class_node} with relation DEFINES")
+        return class_node
+
+    def _add_method_node(self, class_node: str, method_info: MethodInfo):
         """Add a method node to the graph."""
         method_name = method_info.name
         method_node = f"Method: {method_name}"
-        
-        if not self.graph.has_node(method_node):
-            # Convert parameters to a serializable format
-            parameters = [
-                {
-                    'name': param.name,
-                    'type': param.type,
-                    'annotations': param.annotations
-                }
-                for param in method_info.parameters
-            ]
-            
-            self.graph.add_node(
+
+        if method_node not in self._known_nodes:
+            # The Parameter dataclasses go in as-is; _GraphJSONEncoder
+            # converts them at save time instead of building a throwaway
+            # list of dicts per method here
+            self._buffer_node(
                 method_node,
                 type="method",
                 name=method_name,
                 id=method_node,
                 return_type=method_info.return_type,
-                parameters=parameters,
+                parameters=method_info.parameters,
                 annotations=method_info.annotations,
                 modifiers=method_info.modifiers,
                 is_constructor=method_info.is_constructor
             )
             self.stats['total_methods'] += 1
-            logging.debug(f"Method node added: {method_node}, Total methods: {self.stats['total_methods']}")
+            if _DEBUG:
+                logging.debug(f"Method node added: {method_node}, Total methods: {self.stats['total_methods']}")
         else:
-            logging.debug(f"Method node already exists: {method_node}")
-
-        # Link method to its class
-        class_node = f"Class: {class_name}"
-        if self.graph.has_node(class_node):
-            self.graph.add_edge(class_node, method_node, relation="HAS_METHOD")
-            logging.debug(f"Edge added: {class_node} -> {method_node} with relation HAS_METHOD")
+            if _DEBUG:
+                logging.debug(f"Method node already exists: {method_node}")
+
+        # Link method to its declaring class/interface/enum
+        if class_node in self._known_nodes or self.graph.has_node(class_node):
+            self._buffer_edge(class_node, method_node, "HAS_METHOD")
+            if _DEBUG:
+                logging.debug(f"Edge added: {class_node} -> {method_node} with relation HAS_METHOD")
         else:
             logging.warning(f"Class node {class_node} does not exist; cannot add method {method_info.name}")
 
     def _add_annotation_node(self, file_node: str, annotation: str):
         """Add an annotation node to the graph."""
         annotation_node = f"Annotation: {annotation}"
-        
-        if not self.graph.has_node(annotation_node):
-            self.graph.add_node(annotation_node, type="annotation", name=annotation, id=annotation_node)
+
+        if self._buffer_node(annotation_node, type="annotation", name=annotation, id=annotation_node):
             if annotation not in self.stats['total_annotations']:
                 self.stats['total_annotations'].add(annotation)
-                logging.debug(f"Annotation node added: {annotation_node}, Total unique annotations: {len(self.stats['total_annotations'])}")
+                if _DEBUG:
+                    logging.debug(f"Annotation node added: {annotation_node}, Total unique annotations: {len(self.stats['total_annotations'])}")
         else:
-            logging.debug(f"Annotation node already exists: {annotation_node}")
+            if _DEBUG:
+                logging.debug(f"Annotation node already exists: {annotation_node}")
 
-        self.graph.add_edge(file_node, annotation_node, relation="ANNOTATED_WITH")
-        logging.debug(f"Edge added: {file_node} -> {annotation_node} with relation ANNOTATED_WITH")
+        self._buffer_edge(file_node, annotation_node, "ANNOTATED_WITH")
+        if _DEBUG:
+            logging.debug(f"Edge added: {file_node} -> {annotation_node} with relation ANNOTATED_WITH")
 
     def _add_comment_node(self, file_node: str, comment: CommentInfo):
         """Add a comment node to the graph."""
-        comment_id = f"Comment: {comment.line_number}_{hash(comment.content)}"
+        comment_id = f"Comment: {comment.line_number}_{self._stable_hash(comment.content)}"
         comment_node = comment_id
-        if not self.graph.has_node(comment_node):
-            self.graph.add_node(
-                comment_node,
-                type="comment",
-                comment_type=comment.type.value,
-                content=comment.content,
-                line_number=comment.line_number,
-                associated_element=comment.associated_element,
-                tags=comment.tags or [],
-                id=comment_node
-            )
+        if self._buffer_node(
+            comment_node,
+            type="comment",
+            comment_type=comment.type.value,
+            content=comment.content,
+            line_number=comment.line_number,
+            associated_element=comment.associated_element,
+            tags=comment.tags or [],
+            id=comment_node
+        ):
             self.stats['total_comments'] += 1
-        self.graph.add_edge(file_node, comment_node, relation="HAS_COMMENT")
+        self._buffer_edge(file_node, comment_node, "HAS_COMMENT")
 
     def _add_log_statement_node(self, file_node: str, log_info: Dict[str, Any]):
         """Add a log statement node to the graph."""
-        log_id = f"Log: {hash(log_info.get('message', ''))}"
+        log_id = f"Log: {self._stable_hash(log_info.get('message', ''))}"
         log_node = log_id
-        if not self.graph.has_node(log_node):
-            self.graph.add_node(
-                log_node,
-                type="log_statement",
-                level=log_info.get('level', 'INFO'),
-                message=log_info.get('message', ''),
-                id=log_node
-            )
+        if self._buffer_node(
+            log_node,
+            type="log_statement",
+            level=log_info.get('level', 'INFO'),
+            message=log_info.get('message', ''),
+            id=log_node
+        ):
             self.stats['total_logging_statements'] += 1
-        self.graph.add_edge(file_node, log_node, relation="USES")
+        self._buffer_edge(file_node, log_node, "USES")
 
     def _add_integration_node(self, file_node: str, integration: Dict[str, Any]):
         """Add an integration node to the graph."""
         integration_name = integration.get('name', 'unnamed_integration')
         integration_node = f"Integration: {integration_name}"
-        if not self.graph.has_node(integration_node):
-            self.graph.add_node(
-                integration_node,
-                type="api_integration",
-                name=integration_name,
-                url=integration.get('url', ''),
-                id=integration_node
-            )
+        if self._buffer_node(
+            integration_node,
+            type="api_integration",
+            name=integration_name,
+            url=integration.get('url', ''),
+            id=integration_node
+        ):
             self.stats['total_integrations'] += 1
-        self.graph.add_edge(file_node, integration_node, relation="INTEGRATES_WITH")
+        self._buffer_edge(file_node, integration_node, "INTEGRATES_WITH")
 
     def _add_version_info(self, file_node: str, version_info: Dict[str, Any]):
         """Add version information to the graph."""
         for version_type, version_data in version_info.items():
             version_node = f"Version: {version_type}"
-            if not self.graph.has_node(version_node):
-                self.graph.add_node(
-                    version_node,
-                    type="version",
-                    version_type=version_type,
-                    constraints=version_data.get('constraints', ''),
-                    id=version_node
-                )
+            # version_data is a VersionConstraint dataclass; calling
+            # .get() on it raised AttributeError and failed the whole
+            # file, so store it directly and let the encoder serialize it
+            if self._buffer_node(
+                version_node,
+                type="version",
+                version_type=version_type,
+                constraints=version_data,
+                id=version_node
+            ):
                 self.stats['total_version_constraints'] += 1
-            self.graph.add_edge(file_node, version_node, relation="HAS_VERSION")
+            self._buffer_edge(file_node, version_node, "HAS_VERSION")
 
     def _add_localization_usage_node(self, file_node: str, localization: Dict[str, Any]):
         """Add a localization usage node to the graph."""
         localization_path = localization.get('path', 'unknown_path')
         locale = localization.get('locale', 'unknown_locale')
         localization_node = f"i18n: {os.path.splitext(os.path.basename(localization_path))[0]}"
-        if not self.graph.has_node(localization_node):
-            self.graph.add_node(
-                localization_node,
-                type="localization",
-                path=localization_path,
-                locale=locale,
-                id=localization_node
-            )
+        if self._buffer_node(
+            localization_node,
+            type="localization",
+            path=localization_path,
+            locale=locale,
+            id=localization_node
+        ):
             self.stats['total_localizations'] += 1
-        self.graph.add_edge(file_node, localization_node, relation="USES")
+        self._buffer_edge(file_node, localization_node, "USES")
 
     def _process_build_file(self, file_path: str):
         """Process build configuration files."""
@@ -471,15 +949,14 @@ class JavaCodeKnowledgeGraph:
                 dependencies = self.dependency_mapper.extract_gradle_dependencies(file_path)
 
             # Add build script node
-            build_node = f"Build: {os.path.relpath(file_path, self.directory)}"
-            if not self.graph.has_node(build_node):
-                self.graph.add_node(
-                    build_node,
-                    type="build_script",
-                    path=os.path.relpath(file_path, self.directory),
-                    build_tool=build_type.capitalize(),
-                    id=build_node
-                )
+            build_node = f"Build: {self._rel(file_path)}"
+            if self._buffer_node(
+                build_node,
+                type="build_script",
+                path=self._rel(file_path),
+                build_tool=build_type.capitalize(),
+                id=build_node
+            ):
                 self.stats['total_build_scripts'] += 1
 
             for dep in dependencies:
@@ -498,22 +975,21 @@ class JavaCodeKnowledgeGraph:
     def _process_config_file(self, file_path: str):
         """Process configuration files."""
         try:
-            relative_path = os.path.relpath(file_path, self.directory)
+            relative_path = self._rel(file_path)
             config_info = self.config_parser.parse_config_file(file_path)
             if config_info:
                 config_node = f"Config: {relative_path}"
-                if not self.graph.has_node(config_node):
-                    self.graph.add_node(
-                        config_node,
-                        type="config",
-                        path=relative_path,
-                        environment=config_info.config_type.value,
-                        id=config_node
-                    )
+                if self._buffer_node(
+                    config_node,
+                    type="config",
+                    path=relative_path,
+                    environment=config_info.config_type.value,
+                    id=config_node
+                ):
                     self.stats['total_configs'] += 1
                 # Link config to file
                 file_node = f"File: {relative_path}"
-                self.graph.add_edge(file_node, config_node, relation="CONFIGURED_BY")
+                self._buffer_edge(file_node, config_node, "CONFIGURED_BY")
         except AttributeError as ae:
             logging.error(f"AttributeError processing config file {file_path}: {str(ae)}")
             self.stats['files_with_errors'] += 1
@@ -524,21 +1000,20 @@ class JavaCodeKnowledgeGraph:
     def _process_localization_file(self, file_path: str):
         """Process localization files."""
         try:
-            relative_path = os.path.relpath(file_path, self.directory)
+            relative_path = self._rel(file_path)
             locale = self.localization_processor.extract_locale(relative_path)
             localization_node = f"i18n: {os.path.splitext(os.path.basename(relative_path))[0]}"
-            if not self.graph.has_node(localization_node):
-                self.graph.add_node(
-                    localization_node,
-                    type="localization",
-                    path=relative_path,
-                    locale=locale,
-                    id=localization_node
-                )
+            if self._buffer_node(
+                localization_node,
+                type="localization",
+                path=relative_path,
+                locale=locale,
+                id=localization_node
+            ):
                 self.stats['total_localizations'] += 1
             # Link localization to file
             file_node = f"File: {relative_path}"
-            self.graph.add_edge(file_node, localization_node, relation="CONTAINS")
+            self._buffer_edge(file_node, localization_node, "CONTAINS")
 
         except Exception as e:
             logging.error(f"Error processing localization file {file_path}: {str(e)}")
@@ -547,25 +1022,23 @@ class JavaCodeKnowledgeGraph:
     def _process_documentation_file(self, file_path: str):
         """Process documentation files like README.md and API docs."""
         try:
-            relative_path = os.path.relpath(file_path, self.directory)
+            relative_path = self._rel(file_path)
             with open(file_path, 'r', encoding='utf-8') as f:
                 content = f.read()
 
             doc_info = self.doc_analyzer.analyze_documentation(file_path)
             if doc_info:
-                doc_node = f"Documentation: {os.path.relpath(file_path, self.directory)}"
-                if not self.graph.has_node(doc_node):
-                    self.graph.add_node(
-                        doc_node,
-                        type="documentation",
-                        path=file_path,
-                        sections=[section.title for section in doc_info.sections],
-                        id=doc_node
-                    )
+                doc_node = f"Documentation: {self._rel(file_path)}"
+                self._buffer_node(
+                    doc_node,
+                    type="documentation",
+                    path=file_path,
+                    sections=[section.title for section in doc_info.sections],
+                    id=doc_node
+                )
                 project_node = "Project: Main"
-                if not self.graph.has_node(project_node):
-                    self.graph.add_node(project_node, type="project", name="Main Project", id=project_node)
-                self.graph.add_edge(project_node, doc_node, relation="HAS_DOCUMENTATION")
+                self._buffer_node(project_node, type="project", name="Main Project", id=project_node)
+                self._buffer_edge(project_node, doc_node, "HAS_DOCUMENTATION")
 
         except Exception as e:
             logging.error(f"Error processing documentation file {file_path}: {str(e)}")
@@ -574,19 +1047,18 @@ class JavaCodeKnowledgeGraph:
     def _process_generic_file(self, file_path: str):
         """Process generic files that don't fall into specific categories."""
         try:
-            relative_path = os.path.relpath(file_path, self.directory)
+            relative_path = self._rel(file_path)
             file_info = self.file_processor.process_file(file_path)
             if file_info:
                 file_node = f"File: {relative_path}"
-                if not self.graph.has_node(file_node):
-                    self.graph.add_node(
-                        file_node,
-                        type=file_info.type.value,
-                        encoding=file_info.encoding or 'UTF-8',
-                        fileType=file_info.extension,
-                        purpose=file_info.purpose,
-                        id=file_node
-                    )
+                self._buffer_node(
+                    file_node,
+                    type=file_info.type.value,
+                    encoding=file_info.encoding or 'UTF-8',
+                    fileType=file_info.extension,
+                    purpose=file_info.purpose,
+                    id=file_node
+                )
         except AttributeError as ae:
             logging.error(f"AttributeError processing generic file {file_path}: {str(ae)}")
             self.stats['files_with_errors'] += 1
@@ -594,35 +1066,29 @@ class JavaCodeKnowledgeGraph:
             logging.error(f"Error processing generic file {file_path}: {str(e)}")
             self.stats['files_with_errors'] += 1
 
-    def save_graph(self, output_path: str):
-        """Save the knowledge graph to a JSON file."""
+    def save_graph(self, output_path: str, pretty: bool = False):
+        """Save the knowledge graph to a JSON file.
+
+        By default the JSON is written compact: indentation more than
+        doubles the output size of a big graph and makes the encoder
+        emit whitespace between every token. Pass pretty=True for a
+        human-readable file.
+        """
         try:
             # Convert graph to JSON format with explicit edges keyword to suppress FutureWarning
             data = json_graph.node_link_data(self.graph, edges="links")
 
-            # Prepare metadata
+            # Prepare metadata; the stats block is filled from the
+            # shared key order instead of a fresh 19-entry dict literal
+            stats = dict.fromkeys(_STAT_KEYS, 0)
+            stats['total_files'] = self.total_files
+            stats['files_processed'] = self.files_processed
+            for key in _STAT_KEYS[2:]:
+                value = self.stats[key]
+                stats[key] = len(value) if isinstance(value, set) else value
+
             metadata = {
-                "stats": {
-                    "total_files": self.total_files,
-                    "files_processed": self.files_processed,
-                    "files_with_errors": self.stats['files_with_errors'],
-                    "total_classes": self.stats['total_classes'],
-                    "total_interfaces": self.stats['total_interfaces'],
-                    "total_enums": self.stats['total_enums'],
-                    "total_methods": self.stats['total_methods'],
-                    "total_packages": len(self.stats['total_packages']),
-                    "total_imports": self.stats['total_imports'],
-                    "total_dependencies": len(self.stats['total_dependencies']),
-                    "total_annotations": len(self.stats['total_annotations']),
-                    "total_api_endpoints": self.stats['total_api_endpoints'],
-                    "total_logging_statements": self.stats['total_logging_statements'],
-                    "total_comments": self.stats['total_comments'],
-                    "total_configs": self.stats['total_configs'],
-                    "total_integrations": self.stats['total_integrations'],
-                    "total_localizations": self.stats['total_localizations'],
-                    "total_build_scripts": self.stats['total_build_scripts'],
-                    "total_version_constraints": self.stats['total_version_constraints']
-                },
+                "stats": stats,
                 "build_info": {
                     "java_version": self.version_analyzer.extract_java_version(),
                     "build_tool": self.build_extractor.get_build_tool(),
@@ -639,20 +1105,36 @@ class JavaCodeKnowledgeGraph:
                 "dependencies": list(self.stats['total_dependencies'])
             }
 
-            # Combine data and metadata
-            output_data = {
-                "graph": {
-                    "directed": data['directed'],
-                    "multigraph": data['multigraph'],
-                    "nodes": data['nodes'],
-                    "links": data['links']
-                },
-                "metadata": metadata
-            }
-
-            # Save to file
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(output_data, f, indent=2)
+            # Save to file; ensure_ascii=False keeps non-ASCII identifiers
+            # verbatim instead of \u-escaping every character. orjson, if
+            # installed, encodes dataclasses and enums natively and emits
+            # UTF-8 bytes in one pass
+            if orjson is not None or pretty:
+                output_data = {
+                    "graph": {
+                        "directed": data['directed'],
+                        "multigraph": data['multigraph'],
+                        "nodes": data['nodes'],
+                        "links": data['links']
+                    },
+                    "metadata": metadata
+                }
+                if orjson is not None:
+                    with open(output_path, 'wb') as f:
+                        f.write(orjson.dumps(
+                            output_data,
+                            option=orjson.OPT_INDENT_2 if pretty else 0
+                        ))
+                else:
+                    # Encode to one string first: json.dump hands the
+                    # file object a stream of tiny fragments, each a
+                    # separate write, while dumps + one write costs one
+                    payload = json.dumps(output_data, cls=_GraphJSONEncoder,
+                                         ensure_ascii=False, indent=2)
+                    with open(output_path, 'w', encoding='utf-8') as f:
+                        f.write(payload)
+            else:
+                self._write_graph_stream(output_path, data, metadata)
 
             # Log statistics
             logging.info(f"\nAnalysis Statistics:")
@@ -666,58 +1148,39 @@ class JavaCodeKnowledgeGraph:
         except Exception as e:
             logging.error(f"Error saving graph: {str(e)}")
 
+    @staticmethod
+    def _write_graph_stream(output_path: str, data: dict, metadata: dict):
+        """Write the compact JSON output one node/link at a time.
+
+        Encoding the whole document at once holds both the graph and
+        its serialized string in memory together; emitting the skeleton
+        by hand and one element per encode keeps the peak at a single
+        node. The 1 MiB file buffer coalesces the small writes.
+        """
+        encode = _GraphJSONEncoder(ensure_ascii=False,
+                                   separators=(',', ':')).encode
+        with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.write('{"graph":{"directed":%s,"multigraph":%s,"nodes":[' % (
+                'true' if data['directed'] else 'false',
+                'true' if data['multigraph'] else 'false'))
+            for i, node in enumerate(data['nodes']):
+                if i:
+                    f.write(',')
+                f.write(encode(node))
+            f.write('],"links":[')
+            for i, link in enumerate(data['links']):
+                if i:
+                    f.write(',')
+                f.write(encode(link))
+            f.write(']},"metadata":')
+            f.write(encode(metadata))
+            f.write('}')
+
     def generate_example_output_structure(self):
         """Generate an example structure for reference."""
-        example_output = {
-            "graph": {
-                "directed": True,
-                "multigraph": False,
-                "nodes": [
-                    # Nodes will be populated here
-                ],
-                "links": [
-                    # Links will be populated here
-                ]
-            },
-            "metadata": {
-                "stats": {
-                    "total_files": 0,
-                    "files_processed": 0,
-                    "files_with_errors": 0,
-                    "total_classes": 0,
-                    "total_interfaces": 0,
-                    "total_enums": 0,
-                    "total_methods": 0,
-                    "total_packages": 0,
-                    "total_imports": 0,
-                    "total_dependencies": 0,
-                    "total_annotations": 0,
-                    "total_api_endpoints": 0,
-                    "total_logging_statements": 0,
-                    "total_comments": 0,
-                    "total_configs": 0,
-                    "total_integrations": 0,
-                    "total_localizations": 0,
-                    "total_build_scripts": 0,
-                    "total_version_constraints": 0
-                },
-                "build_info": {
-                    "java_version": "",
-                    "build_tool": "",
-                    "main_class": ""
-                },
-                "documentation": {
-                    "readme_path": "",
-                    "api_docs": "",
-                    "coverage_threshold": 0
-                },
-                "analysis_timestamp": "",
-                "analyzed_directory": "",
-                "packages": [],
-                "dependencies": []
-            }
-        }
-        return example_output
+        # Deep copy so callers can populate the nested dicts without
+        # mutating the shared template
+        return copy.deepcopy(_EXAMPLE_OUTPUT_TEMPLATE)
 
     def visualize_graph(self):
         """Visualize the knowledge graph."""
@@ -812,6 +1275,10 @@ if __name__ == "__main__":
         print("Java Code Knowledge Graph Generator")
         print("----------------------------------")
 
+        jobs = None
+        if "--jobs" in sys.argv:
+            jobs = int(sys.argv[sys.argv.index("--jobs") + 1])
+
         codebase_dir = input("Enter the path to the codebase directory: ").strip()
         if not os.path.exists(codebase_dir):
             raise ValueError(f"Directory does not exist: {codebase_dir}")
@@ -819,7 +1286,7 @@ if __name__ == "__main__":
         output_file = "java_code_knowledge_graph.json"
 
         # Create and analyze the codebase
-        graph_generator = JavaCodeKnowledgeGraph(directory=codebase_dir)
+        graph_generator = JavaCodeKnowledgeGraph(directory=codebase_dir, jobs=jobs)
         graph_generator.analyze_codebase()
 
         # Save the graph
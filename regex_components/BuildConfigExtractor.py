@@ -1,12 +1,78 @@
 from typing import Dict, List, Optional, Any
+import os
 import re
-import xml.etree.ElementTree as ET
+import functools
+
+# lxml parses large enterprise poms several times faster than the
+# stdlib parser and its findall/namespace API is call-compatible here;
+# fall back to ElementTree when it is not installed
+try:
+    from lxml import etree as ET
+except ImportError:
+    import xml.etree.ElementTree as ET
 from pathlib import Path
 from dataclasses import dataclass
 import json
 import logging
 
-@dataclass
+# Patterns compiled once at import so every extractor instance and call
+# shares them instead of re-running re.compile
+_GRADLE_DEP_RE = re.compile(
+    r'(?P<config>implementation|api|compile|testImplementation|runtimeOnly)'
+    r'\s*[\'"]((?P<group>[^:]+):(?P<name>[^:]+):(?P<version>[^\'"]*))[\'"]'
+)
+_GRADLE_PLUGIN_RE = re.compile(r'apply\s+plugin:\s+[\'"]([^\'"]+)[\'"]')
+_GRADLE_REPO_RE = re.compile(r'maven\s*{\s*url\s+[\'"]([^\'"]+)[\'"]')
+# One alternation walks a Dockerfile once instead of one full scan per
+# instruction kind; the matching branch is identified by its named group
+_DOCKERFILE_RE = re.compile(
+    r'^(?:FROM\s+(?P<from_val>.+)'
+    r'|ENV\s+(?P<env_key>\w+)\s+(?P<env_val>.+)'
+    r'|RUN\s+(?P<run_val>.+))$',
+    re.MULTILINE
+)
+_ENV_VAR_RE = re.compile(r'^([^=#]+)=(.*)$', re.MULTILINE)
+
+
+@functools.lru_cache(maxsize=1024)
+def _detect_build_tool(project_dir: str) -> str:
+    """Detect the build tool used under project_dir.
+
+    Cached at module level so every extractor instance probing the same
+    directory shares one lookup. A single scandir listing replaces the
+    three per-file exists() stat calls.
+    """
+    try:
+        with os.scandir(project_dir) as it:
+            names = {entry.name for entry in it if entry.is_file()}
+    except OSError:
+        return 'unknown'
+    if 'pom.xml' in names:
+        return 'maven'
+    if 'build.gradle' in names or 'build.gradle.kts' in names:
+        return 'gradle'
+    return 'unknown'
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_gradle_properties(path: str, mtime: float) -> 'tuple[tuple[str, str], ...]':
+    """Parse a gradle.properties file into (key, value) pairs.
+
+    Cached on (path, mtime): mono-repos share one root gradle.properties
+    across subprojects, so every module after the first reuses the parse
+    while edits to the file still invalidate the entry. Returns an
+    immutable tuple so cached results cannot be mutated by callers.
+    """
+    pairs = []
+    with open(path, encoding='utf-8') as f:
+        for line in f.read().splitlines():
+            if '=' in line and not line.startswith('#'):
+                key, value = line.split('=', 1)
+                pairs.append((key.strip(), value.strip()))
+    return tuple(pairs)
+
+
+@dataclass(slots=True)
 class BuildConfig:
     build_tool: str
     dependencies: List[Dict[str, str]]
@@ -19,20 +85,16 @@ class BuildConfigExtractor:
     def __init__(self):
         self.maven_ns = {'mvn': 'http://maven.apache.org/POM/4.0.0'}
         self._build_tool = None  # Cache for build tool type
+        self._maven_configs = {}  # (path, mtime) -> parsed BuildConfig
         
         # Gradle dependency patterns
-        self.gradle_dep_pattern = re.compile(
-            r'(?P<config>implementation|api|compile|testImplementation|runtimeOnly)'
-            r'\s*[\'"]((?P<group>[^:]+):(?P<name>[^:]+):(?P<version>[^\'"]*))[\'"]'
-        )
-        
+        self.gradle_dep_pattern = _GRADLE_DEP_RE
+
         # Docker patterns
-        self.dockerfile_from_pattern = re.compile(r'^FROM\s+(.+)$', re.MULTILINE)
-        self.dockerfile_env_pattern = re.compile(r'^ENV\s+(\w+)\s+(.+)$', re.MULTILINE)
-        self.dockerfile_run_pattern = re.compile(r'^RUN\s+(.+)$', re.MULTILINE)
-        
+        self.dockerfile_pattern = _DOCKERFILE_RE
+
         # Environment patterns
-        self.env_var_pattern = re.compile(r'^([^=#]+)=(.*)$', re.MULTILINE)
+        self.env_var_pattern = _ENV_VAR_RE
 
     def get_build_tool(self) -> str:
         """
@@ -46,31 +108,29 @@ class BuildConfigExtractor:
             # Return cached value if available
             if self._build_tool is not None:
                 return self._build_tool
-            
-            # Check for Maven pom.xml in current directory
-            if Path('pom.xml').exists():
-                self._build_tool = 'maven'
-                return self._build_tool
-            
-            # Check for Gradle build files
-            if Path('build.gradle').exists() or Path('build.gradle.kts').exists():
-                self._build_tool = 'gradle'
-                return self._build_tool
-                
-            # No recognized build tool found
-            self._build_tool = 'unknown'
+
+            # Probes the current directory, as before; the shared
+            # module-level cache absorbs repeat lookups across instances
+            self._build_tool = _detect_build_tool(str(Path.cwd()))
             return self._build_tool
-            
+
         except Exception as e:
             logging.error(f"Error determining build tool: {str(e)}")
             return 'unknown'
 
-    def extract_dependencies_from_pom(self, pom_path: str) -> List[Dict[str, str]]:
-        """Extract dependencies from Maven pom.xml file."""
+    def extract_dependencies_from_pom(self, pom_path: Optional[str] = None,
+                                      root: Optional[ET.Element] = None) -> List[Dict[str, str]]:
+        """Extract dependencies from Maven pom.xml file.
+
+        Accepts either a path or an already-parsed document root, so
+        callers that parsed the pom for other sections do not trigger a
+        second full XML parse.
+        """
         try:
-            tree = ET.parse(pom_path)
-            root = tree.getroot()
-            
+            if root is None:
+                tree = ET.parse(pom_path)
+                root = tree.getroot()
+
             dependencies = []
             for dep in root.findall('.//mvn:dependency', self.maven_ns):
                 group_id = dep.find('mvn:groupId', self.maven_ns)
@@ -92,10 +152,16 @@ class BuildConfigExtractor:
             logging.error(f"Error parsing pom.xml {pom_path}: {str(e)}")
             return []
 
-    def extract_dependencies_from_gradle(self, build_gradle_path: str) -> List[Dict[str, str]]:
-        """Extract dependencies from build.gradle file."""
+    def extract_dependencies_from_gradle(self, build_gradle_path: Optional[str] = None,
+                                         content: Optional[str] = None) -> List[Dict[str, str]]:
+        """Extract dependencies from build.gradle file.
+
+        Accepts either a path or already-read file content, so callers
+        holding the text do not trigger a second read.
+        """
         try:
-            content = Path(build_gradle_path).read_text(encoding='utf-8')
+            if content is None:
+                content = Path(build_gradle_path).read_text(encoding='utf-8')
             dependencies = []
             
             for match in self.gradle_dep_pattern.finditer(content):
@@ -112,17 +178,45 @@ class BuildConfigExtractor:
             logging.error(f"Error parsing build.gradle {build_gradle_path}: {str(e)}")
             return []
 
+    def parse_dockerfile(self, content: str) -> Dict[str, Any]:
+        """Extract FROM/ENV/RUN instructions from Dockerfile content.
+
+        A single pass over the combined pattern replaces one full scan
+        per instruction kind.
+        """
+        base_images: List[str] = []
+        env_vars: Dict[str, str] = {}
+        run_commands: List[str] = []
+        try:
+            for match in _DOCKERFILE_RE.finditer(content):
+                from_val = match.group('from_val')
+                if from_val is not None:
+                    base_images.append(from_val.strip())
+                elif match.group('env_key') is not None:
+                    env_vars[match.group('env_key')] = match.group('env_val').strip()
+                else:
+                    run_commands.append(match.group('run_val').strip())
+        except Exception as e:
+            logging.error(f"Error parsing Dockerfile content: {str(e)}")
+
+        return {
+            'base_images': base_images,
+            'env_vars': env_vars,
+            'run_commands': run_commands
+        }
+
     def analyze_build_config(self, project_dir: str) -> Optional[BuildConfig]:
         """Analyze build configuration files in a project directory."""
         try:
-            # Check for Maven
-            pom_path = Path(project_dir) / 'pom.xml'
-            if pom_path.exists():
+            # Plain string joins and isfile() probes: the pathlib
+            # equivalents allocate several objects per call in this hot
+            # path without adding anything
+            pom_path = os.path.join(project_dir, 'pom.xml')
+            if os.path.isfile(pom_path):
                 return self._analyze_maven_config(pom_path)
-                
-            # Check for Gradle
-            build_gradle_path = Path(project_dir) / 'build.gradle'
-            if build_gradle_path.exists():
+
+            build_gradle_path = os.path.join(project_dir, 'build.gradle')
+            if os.path.isfile(build_gradle_path):
                 return self._analyze_gradle_config(build_gradle_path)
                 
             logging.warning(f"No recognized build configuration found in {project_dir}")
@@ -132,13 +226,24 @@ class BuildConfigExtractor:
             logging.error(f"Error analyzing build config in {project_dir}: {str(e)}")
             return None
 
-    def _analyze_maven_config(self, pom_path: Path) -> BuildConfig:
-        """Analyze Maven configuration from pom.xml."""
+    def _analyze_maven_config(self, pom_path: str) -> BuildConfig:
+        """Analyze Maven configuration from pom.xml.
+
+        Parsed configs are kept keyed by (path, mtime), so repeated
+        analyze_build_config calls in one run skip the XML re-parse
+        while edits to the POM still invalidate the entry.
+        """
+        cache_key = (pom_path, os.path.getmtime(pom_path))
+        cached = self._maven_configs.get(cache_key)
+        if cached is not None:
+            return cached
+
         tree = ET.parse(pom_path)
         root = tree.getroot()
-        
-        # Extract dependencies
-        dependencies = self.extract_dependencies_from_pom(str(pom_path))
+
+        # Extract dependencies from the document parsed above instead of
+        # letting the helper re-parse the same file
+        dependencies = self.extract_dependencies_from_pom(root=root)
         
         # Extract plugins
         plugins = []
@@ -176,7 +281,7 @@ class BuildConfigExtractor:
             if repo_url is not None:
                 repositories.append(repo_url.text)
         
-        return BuildConfig(
+        config = BuildConfig(
             build_tool='maven',
             dependencies=dependencies,
             plugins=plugins,
@@ -184,35 +289,37 @@ class BuildConfigExtractor:
             profiles=profiles,
             repositories=repositories
         )
+        self._maven_configs[cache_key] = config
+        return config
 
-    def _analyze_gradle_config(self, gradle_path: Path) -> BuildConfig:
+    def _analyze_gradle_config(self, gradle_path: str) -> BuildConfig:
         """Analyze Gradle configuration from build.gradle."""
-        content = gradle_path.read_text(encoding='utf-8')
-        
-        # Extract dependencies
-        dependencies = self.extract_dependencies_from_gradle(str(gradle_path))
+        with open(gradle_path, encoding='utf-8') as f:
+            content = f.read()
+
+        # Extract dependencies from the content read above instead of
+        # letting the helper re-read the file
+        dependencies = self.extract_dependencies_from_gradle(content=content)
         
         # Extract plugins (basic implementation)
-        plugin_pattern = re.compile(r'apply\s+plugin:\s+[\'"]([^\'"]+)[\'"]')
         plugins = [
             {'id': match.group(1)}
-            for match in plugin_pattern.finditer(content)
+            for match in _GRADLE_PLUGIN_RE.finditer(content)
         ]
         
-        # Extract properties (from gradle.properties if exists)
+        # Extract properties (from gradle.properties if exists); the
+        # mtime-keyed cache absorbs the shared-root re-parse in mono-repos
         properties = {}
-        prop_file = gradle_path.parent / 'gradle.properties'
-        if prop_file.exists():
-            for line in prop_file.read_text(encoding='utf-8').splitlines():
-                if '=' in line and not line.startswith('#'):
-                    key, value = line.split('=', 1)
-                    properties[key.strip()] = value.strip()
+        prop_file = os.path.join(os.path.dirname(gradle_path), 'gradle.properties')
+        if os.path.isfile(prop_file):
+            properties = dict(
+                _parse_gradle_properties(prop_file, os.path.getmtime(prop_file))
+            )
         
         # Extract repositories
-        repo_pattern = re.compile(r'maven\s*{\s*url\s+[\'"]([^\'"]+)[\'"]')
         repositories = [
             match.group(1)
-            for match in repo_pattern.finditer(content)
+            for match in _GRADLE_REPO_RE.finditer(content)
         ]
         
         return BuildConfig(
@@ -1,9 +1,22 @@
 from typing import Dict, List, Optional, Set, Any
 import re
+import sys
 import logging
+import functools
 from dataclasses import dataclass
 from enum import Enum
 
+# The extraction patterns below use possessive quantifiers (*+), which
+# the re module only understands from Python 3.11. On older interpreters
+# the compiles below would die with an opaque re.error, so fail early
+# with an actionable message instead.
+if sys.version_info < (3, 11):
+    raise ImportError(
+        "CodeIdentifierExtractor requires Python 3.11 or newer: its regex "
+        "patterns use possessive quantifiers, which older re modules cannot "
+        f"compile (running {sys.version_info.major}.{sys.version_info.minor})."
+    )
+
 class ElementType(Enum):
     CLASS = "class"
     INTERFACE = "interface"
@@ -13,13 +26,13 @@ class ElementType(Enum):
     CONSTRUCTOR = "constructor"
     ANNOTATION = "annotation"
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Parameter:
     name: str
     type: str
     annotations: List[str]
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MethodInfo:
     name: str
     return_type: str
@@ -28,7 +41,7 @@ class MethodInfo:
     modifiers: List[str]
     is_constructor: bool
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ClassInfo:
     name: str
     type: ElementType
@@ -39,193 +52,398 @@ class ClassInfo:
     methods: List[MethodInfo]
     fields: List[Dict[str, Any]]
 
+def strip_comments_and_strings(content: str) -> str:
+    """Return a copy of Java source with comments and string literals blanked.
+
+    Comment bodies and string/char literal contents are replaced with
+    same-length whitespace (newlines are preserved) so that character
+    offsets and line numbers in the stripped copy line up with the
+    original. Feeding the stripped copy to the structural regexes avoids
+    false positives like a 'public class Foo' inside a Javadoc comment
+    or a string literal, and cuts regex backtracking on commented braces.
+    """
+    out = list(content)
+    i, n = 0, len(content)
+    while i < n:
+        ch = content[i]
+        if ch == '/' and i + 1 < n and content[i + 1] == '/':
+            j = content.find('\n', i)
+            if j == -1:
+                j = n
+            out[i:j] = ' ' * (j - i)
+            i = j
+        elif ch == '/' and i + 1 < n and content[i + 1] == '*':
+            j = content.find('*/', i + 2)
+            j = n if j == -1 else j + 2
+            out[i:j] = ('\n' if c == '\n' else ' ' for c in content[i:j])
+            i = j
+        elif ch == '"' or ch == "'":
+            j = i + 1
+            while j < n:
+                c = content[j]
+                if c == '\\':
+                    j += 2
+                    continue
+                if c == ch or c == '\n':
+                    break
+                j += 1
+            j = min(j, n - 1)
+            out[i + 1:j] = ' ' * (j - i - 1)
+            i = j + 1
+        else:
+            i += 1
+    return ''.join(out)
+
+
+# Regex patterns for Java code elements, compiled once at import time so
+# per-file extractor instances share them. Annotation and modifier
+# prefixes use possessive quantifiers (*+): an annotation can never be
+# re-read as a modifier or a modifier as a type, so letting the engine
+# backtrack into these groups only re-tries splits that can never match.
+# Type groups must end on a non-space character for the same reason: it
+# removes the type-vs-separator whitespace ambiguity that made failing
+# scans quadratic. re.ASCII turns \w and \s into 128-entry bitset
+# checks; Java keywords and the overwhelming majority of identifiers
+# are ASCII (non-ASCII identifier characters are legal but essentially
+# unused in practice).
+_CLASS_RE = re.compile(
+    r'(?P<annotations>(?:@[\w\.]+(?:\([^\)]*\))?\s*)*+)'  # Changed to handle qualified annotation names
+    r'(?P<modifiers>(?:public|protected|private|static|final|abstract)\s+)*+'
+    r'(?P<type>class|interface|enum)\s+'
+    r'(?P<name>\w+)'
+    r'(?:\s+extends\s+(?P<extends>[\w\.]+))?'  # Changed to handle qualified class names
+    r'(?:\s+implements\s+(?P<implements>[\w\.,\s]+))?\s*'
+    r'\{',
+    re.ASCII
+)
+
+_METHOD_RE = re.compile(
+    r'(?P<annotations>(?:@\w+(?:\([^)]*\))?\s*)*+)'
+    r'(?P<modifiers>(?:public|private|protected|static|final|abstract|synchronized)\s+)*+'
+    r'(?P<return_type>[\w.$]+(?:\s*<[^{};()]*>)?(?:\s*\[\s*\])*)\s+'
+    r'(?P<name>\w+)\s*'
+    r'\((?P<parameters>[^)]*)\)\s*'
+    r'(?:throws\s+[\w,\s]+)?\s*'
+    r'\{',
+    re.ASCII
+)
+
+_FIELD_RE = re.compile(
+    r'(?P<annotations>(?:@\w+(?:\([^)]*\))?\s*)*+)'
+    r'(?P<modifiers>(?:public|private|protected|static|final|volatile|transient)\s+)*+'
+    r'(?P<type>[\w.$]+(?:\s*<[^{};()]*>)?(?:\s*\[\s*\])*)\s+'
+    r'(?P<name>\w+)\s*'
+    r'(?:=\s*(?P<initializer>[^;]+))?;',
+    re.ASCII
+)
+
+# Method and field branches merged into one alternation so a class body
+# is traversed once instead of once per member kind; the branch that
+# matched is identified by its name group
+_MEMBER_RE = re.compile(
+    r'(?P<annotations>(?:@\w+(?:\([^)]*\))?\s*)*+)'
+    r'(?P<modifiers>(?:public|private|protected|static|final|abstract|synchronized|volatile|transient)\s+)*+'
+    r'(?:'
+    r'(?P<return_type>[\w.$]+(?:\s*<[^{};()]*>)?(?:\s*\[\s*\])*)\s+'
+    r'(?P<method_name>\w+)\s*'
+    r'\((?P<parameters>[^)]*)\)\s*'
+    r'(?:throws\s+[\w,\s]+)?\s*'
+    r'\{'
+    r'|'
+    r'(?P<field_type>[\w.$]+(?:\s*<[^{};()]*>)?(?:\s*\[\s*\])*)\s+'
+    r'(?P<field_name>\w+)\s*'
+    r'(?:=\s*(?P<initializer>[^;]+))?;'
+    r')',
+    re.ASCII
+)
+
+_ANNOTATION_RE = re.compile(r'@(\w+)(?:\([^)]*\))?', re.ASCII)
+
+# Tokens that matter when pairing braces; everything between them is
+# skipped at C speed instead of stepped over character by character
+_BLOCK_TOKEN_RE = re.compile(r'[{}"\']|//|/\*')
+
+_SPRING_BOOT_MAIN_RE = re.compile(
+    r'@SpringBootApplication\s+public\s+class\s+(\w+)'
+)
+_MAIN_METHOD_RE = re.compile(
+    r'public\s+class\s+(\w+)(?:.*?public\s+static\s+void\s+main\s*\([^)]*\))',
+    re.DOTALL
+)
+
+
 class CodeIdentifierExtractor:
     def __init__(self):
-        # Regex patterns for Java code elements
-        self.class_pattern = re.compile(
-            r'(?P<annotations>(?:@[\w\.]+(?:\([^\)]*\))?\s*)*)'  # Changed to handle qualified annotation names
-            r'\s*'
-            r'(?P<modifiers>(?:public|protected|private|static|final|abstract)\s+)*'
-            r'(?P<type>class|interface|enum)\s+'
-            r'(?P<name>\w+)'
-            r'(?:\s+extends\s+(?P<extends>[\w\.]+))?'  # Changed to handle qualified class names
-            r'(?:\s+implements\s+(?P<implements>[\w\.,\s]+))?\s*'
-            r'\{'
-        )
+        # Shared module-level patterns; instance attributes are kept for
+        # callers that reference them directly
+        self.class_pattern = _CLASS_RE
+        self.method_pattern = _METHOD_RE
+        self.field_pattern = _FIELD_RE
+        self.member_pattern = _MEMBER_RE
+        self.annotation_pattern = _ANNOTATION_RE
 
-        self.method_pattern = re.compile(
-            r'(?P<annotations>(?:@\w+(?:\([^)]*\))?\s*)*)'
-            r'\s*'  # Allow whitespace between annotations and modifiers
-            r'(?P<modifiers>(?:public|private|protected|static|final|abstract|synchronized)\s+)*'
-            r'(?P<return_type>[\w<>[\],\s]+)\s+'
-            r'(?P<name>\w+)\s*'
-            r'\((?P<parameters>[^)]*)\)\s*'
-            r'(?:throws\s+[\w,\s]+)?\s*'
-            r'\{'
-        )
+    def extract_classes(self, content: str) -> List[ClassInfo]:
+        """Extract all class, interface, and enum declarations from Java content."""
+        # A substring probe runs at C speed; files with no type keyword
+        # (package-info and the like) never reach the declaration regex
+        if ('class' not in content and 'interface' not in content
+                and 'enum' not in content):
+            return []
+        matches = list(self.class_pattern.finditer(content))
+        if not matches:
+            return []
+        # One brace-map pass shared by every declaration in the file, so
+        # nested classes no longer trigger repeated tail re-scans
+        brace_map = self._match_braces(content)
+        return [self._finalize_class(match, content, brace_map)
+                for match in matches]
+
+    def _finalize_class(self, match: 're.Match', content: str,
+                        brace_map: Dict[int, int]) -> ClassInfo:
+        """Build the ClassInfo for one declaration match."""
+        class_data = match.groupdict()
+        class_name = class_data['name']
+
+        annotations = self.extract_annotations(class_data['annotations'] or '')
+        modifiers = tuple(sys.intern(mod) for mod in (class_data['modifiers'] or '').split())
+        implements = [imp.strip() for imp in (class_data['implements'] or '').split(',') if imp.strip()]
+
+        # Scan methods and fields in place via pos/endpos offsets rather
+        # than copying the class body into a fresh substring
+        open_idx = match.end() - 1
+        close_idx = brace_map.get(open_idx, -1)
+        if close_idx != -1:
+            methods, fields = self._extract_members(content, class_name, open_idx + 1, close_idx)
+        else:
+            methods = []
+            fields = []
 
-        self.field_pattern = re.compile(
-            r'(?P<annotations>(?:@\w+(?:\([^)]*\))?\s*)*)'
-            r'\s*'  # Allow whitespace between annotations and modifiers
-            r'(?P<modifiers>(?:public|private|protected|static|final|volatile|transient)\s+)*'
-            r'(?P<type>[\w<>[\],\s]+)\s+'
-            r'(?P<name>\w+)\s*'
-            r'(?:=\s*(?P<initializer>[^;]+))?;'
+        return ClassInfo(
+            name=class_name,
+            type=ElementType[class_data['type'].upper()],
+            annotations=annotations,
+            modifiers=modifiers,
+            extends=class_data['extends'],
+            implements=implements,
+            methods=methods,
+            fields=fields
         )
 
-        self.annotation_pattern = re.compile(r'@(\w+)(?:\([^)]*\))?')
-        self.parameter_pattern = re.compile(
-            r'(?P<annotations>(?:@\w+(?:\([^)]*\))?\s*)*)'
-            r'(?P<type>[\w<>[\],\s]+)\s+'
-            r'(?P<name>\w+)'
+    def extract_methods(self, content: str, class_name: Optional[str] = None,
+                        start: int = 0, end: Optional[int] = None) -> List[MethodInfo]:
+        """Extract all method declarations from Java content.
+
+        start/end restrict the scan to a region (typically a class body)
+        without slicing out a copy of it.
+        """
+        if '(' not in content:
+            return []
+        if end is None:
+            end = len(content)
+        # A comprehension appends with the specialized LIST_APPEND
+        # bytecode instead of a method call per match
+        return [self._finalize_method(match, class_name)
+                for match in self.method_pattern.finditer(content, start, end)]
+
+    def _finalize_method(self, match: 're.Match',
+                         class_name: Optional[str]) -> MethodInfo:
+        """Build the MethodInfo for one declaration match."""
+        method_data = match.groupdict()
+        return MethodInfo(
+            name=method_data['name'],
+            return_type=sys.intern(method_data['return_type'].strip()),
+            parameters=self._extract_parameters(method_data['parameters']),
+            annotations=self.extract_annotations(method_data['annotations'] or ''),
+            modifiers=tuple(sys.intern(mod) for mod in (method_data['modifiers'] or '').split()),
+            # A constructor is a method whose name matches its class
+            is_constructor=(class_name is not None and method_data['name'] == class_name)
         )
 
-    def extract_classes(self, content: str) -> List[ClassInfo]:
-        """Extract all class, interface, and enum declarations from Java content."""
-        classes = []
-        for match in self.class_pattern.finditer(content):
-            class_data = match.groupdict()
-            class_name = class_data['name']
-            
-            # Get the class block content
-            start_idx = match.end()
-            class_block = self._extract_block_content(content[start_idx - 1:])
-            
-            # Process class information
-            annotations = self.extract_annotations(class_data['annotations'] or '')
-            modifiers = [mod for mod in (class_data['modifiers'] or '').split() if mod]
-            implements = [imp.strip() for imp in (class_data['implements'] or '').split(',') if imp.strip()]
-            
-            # Extract methods and fields from the class block
-            methods = self.extract_methods(class_block, class_name)
-            fields = self.extract_fields(class_block)
-            
-            classes.append(ClassInfo(
-                name=class_name,
-                type=ElementType[class_data['type'].upper()],
-                annotations=annotations,
-                modifiers=modifiers,
-                extends=class_data['extends'],
-                implements=implements,
-                methods=methods,
-                fields=fields
-            ))
-            
-        return classes
-
-    def extract_methods(self, content: str, class_name: Optional[str] = None) -> List[MethodInfo]:
-        """Extract all method declarations from Java content."""
-        methods = []
-        for match in self.method_pattern.finditer(content):
-            method_data = match.groupdict()
-            
-            # Process annotations and modifiers
-            annotations = self.extract_annotations(method_data['annotations'] or '')
-            modifiers = [mod for mod in (method_data['modifiers'] or '').split() if mod]
-            
-            # Process parameters
-            parameters = self._extract_parameters(method_data['parameters'])
-            
-            # Check if it's a constructor (name matches class name)
-            is_constructor = (class_name is not None and method_data['name'] == class_name)
-            
-            methods.append(MethodInfo(
-                name=method_data['name'],
-                return_type=method_data['return_type'].strip(),
-                parameters=parameters,
-                annotations=annotations,
-                modifiers=modifiers,
-                is_constructor=is_constructor
-            ))
-            
-        return methods
-
-    def extract_fields(self, content: str) -> List[Dict[str, Any]]:
-        """Extract all field declarations from Java content."""
-        fields = []
-        for match in self.field_pattern.finditer(content):
-            field_data = match.groupdict()
-            
-            annotations = self.extract_annotations(field_data['annotations'] or '')
-            modifiers = [mod for mod in (field_data['modifiers'] or '').split() if mod]
-            
-            fields.append({
-                'name': field_data['name'],
-                'type': field_data['type'].strip(),
-                'annotations': annotations,
-                'modifiers': modifiers,
-                'initializer': field_data['initializer'].strip() if field_data['initializer'] else None
-            })
-            
-        return fields
-
-    def extract_annotations(self, annotations_str: str) -> List[str]:
-        """Extract annotation names from a string of annotations."""
-        return [match.group(1) for match in self.annotation_pattern.finditer(annotations_str)]
-
-    def _extract_parameters(self, parameters_str: str) -> List[Parameter]:
-        """Extract parameters from a method parameter string."""
-        parameters = []
+    def extract_fields(self, content: str, start: int = 0,
+                       end: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Extract all field declarations from Java content.
+
+        start/end restrict the scan to a region (typically a class body)
+        without slicing out a copy of it.
+        """
+        if ';' not in content:
+            return []
+        if end is None:
+            end = len(content)
+        return [self._finalize_field(match)
+                for match in self.field_pattern.finditer(content, start, end)]
+
+    def _finalize_field(self, match: 're.Match') -> Dict[str, Any]:
+        """Build the field record for one declaration match."""
+        field_data = match.groupdict()
+        return {
+            'name': field_data['name'],
+            'type': sys.intern(field_data['type'].strip()),
+            'annotations': self.extract_annotations(field_data['annotations'] or ''),
+            'modifiers': tuple(sys.intern(mod) for mod in (field_data['modifiers'] or '').split()),
+            'initializer': field_data['initializer'].strip() if field_data['initializer'] else None
+        }
+
+    def _extract_members(self, content: str, class_name: Optional[str],
+                         start: int, end: int) -> tuple:
+        """Collect the methods and fields of a class body in one pass.
+
+        Running the combined member_pattern once halves the regex
+        traversal of every class body compared to separate method and
+        field scans.
+        """
+        methods: List[MethodInfo] = []
+        fields: List[Dict[str, Any]] = []
+        for match in self.member_pattern.finditer(content, start, end):
+            annotations = self.extract_annotations(match.group('annotations') or '')
+            modifiers = tuple(sys.intern(mod) for mod in (match.group('modifiers') or '').split())
+
+            method_name = match.group('method_name')
+            if method_name is not None:
+                methods.append(MethodInfo(
+                    name=method_name,
+                    return_type=sys.intern(match.group('return_type').strip()),
+                    parameters=self._extract_parameters(match.group('parameters')),
+                    annotations=annotations,
+                    modifiers=modifiers,
+                    is_constructor=(class_name is not None and method_name == class_name)
+                ))
+            else:
+                initializer = match.group('initializer')
+                fields.append({
+                    'name': match.group('field_name'),
+                    'type': sys.intern(match.group('field_type').strip()),
+                    'annotations': annotations,
+                    'modifiers': modifiers,
+                    'initializer': initializer.strip() if initializer else None
+                })
+
+        return methods, fields
+
+    @staticmethod
+    @functools.lru_cache(maxsize=8192)
+    def extract_annotations(annotations_str: str) -> tuple:
+        """Extract annotation names from a string of annotations.
+
+        The same handful of annotation strings recurs across a whole
+        codebase, so results are memoized on the raw input; the cached
+        value is a tuple of interned names, immutable and shared by
+        every caller.
+        """
+        # Most members carry no annotations at all; a substring probe
+        # settles that at C speed without entering the regex engine
+        if '@' not in annotations_str:
+            return ()
+        return tuple(sys.intern(match.group(1)) for match in _ANNOTATION_RE.finditer(annotations_str))
+
+    @staticmethod
+    def _split_parameters(parameters_str: str) -> List[str]:
+        """Split a parameter list on top-level commas only.
+
+        Tracks angle-bracket and parenthesis depth so generic types like
+        Map<String, List<Integer>> are not broken apart at their inner
+        commas.
+        """
+        fragments = []
+        depth = 0
+        start = 0
+        for i, ch in enumerate(parameters_str):
+            if ch in '<(':
+                depth += 1
+            elif ch in '>)':
+                depth -= 1
+            elif ch == ',' and depth == 0:
+                fragments.append(parameters_str[start:i])
+                start = i + 1
+        fragments.append(parameters_str[start:])
+        return [f for f in (fragment.strip() for fragment in fragments) if f]
+
+    @staticmethod
+    @functools.lru_cache(maxsize=8192)
+    def _extract_parameters(parameters_str: str) -> tuple:
+        """Extract parameters from a method parameter string.
+
+        Memoized like extract_annotations: signatures such as an empty
+        list or '(String[] args)' repeat constantly, and the returned
+        Parameter tuple is never mutated downstream.
+        """
         if not parameters_str.strip():
-            return parameters
-                
-        for param_match in self.parameter_pattern.finditer(parameters_str):
-            param_data = param_match.groupdict()
-            annotations = self.extract_annotations(param_data['annotations'] or '')
-            
+            return ()
+
+        parameters = []
+        for fragment in CodeIdentifierExtractor._split_parameters(parameters_str):
+            annotations = CodeIdentifierExtractor.extract_annotations(fragment)
+            declaration = _ANNOTATION_RE.sub('', fragment).strip()
+
+            # Last whitespace-separated token is the name, the rest is the type
+            type_str, _, name = declaration.rpartition(' ')
+            if not type_str or not name.isidentifier():
+                continue
+
             parameters.append(Parameter(
-                name=param_data['name'],
-                type=param_data['type'].strip(),
+                name=name,
+                type=sys.intern(type_str.strip()),
                 annotations=annotations
             ))
-            
-        return parameters
+
+        return tuple(parameters)
+
+    def _match_braces(self, content: str) -> Dict[int, int]:
+        """Map every '{' offset to its matching '}' offset in one pass.
+
+        Strings, character literals, and comments are skipped so braces
+        inside them do not unbalance the stack.
+        """
+        pairs: Dict[int, int] = {}
+        stack: List[int] = []
+        search = _BLOCK_TOKEN_RE.search
+        i, n = 0, len(content)
+        # Jump from token to token with the regex engine; the ordinary
+        # code between braces, quotes, and comment openers never passes
+        # through the Python-level loop at all
+        while True:
+            m = search(content, i)
+            if m is None:
+                break
+            token = m.group()
+            pos = m.start()
+            if token == '{':
+                stack.append(pos)
+                i = pos + 1
+            elif token == '}':
+                if stack:
+                    pairs[stack.pop()] = pos
+                i = pos + 1
+            elif token == '//':
+                j = content.find('\n', pos)
+                i = n if j == -1 else j + 1
+            elif token == '/*':
+                j = content.find('*/', pos + 2)
+                i = n if j == -1 else j + 2
+            else:  # string or char literal
+                j = pos + 1
+                while j < n:
+                    c = content[j]
+                    if c == '\\':
+                        j += 2
+                        continue
+                    if c == token or c == '\n':
+                        break
+                    j += 1
+                i = j + 1
+        return pairs
 
     def _extract_block_content(self, content: str) -> str:
-        """Extract content between first { and its matching }."""
-        depth = 0
-        in_string = False
-        in_char = False
-        in_comment = False
-        string_char = None
-        start_pos = -1
-        
-        for i, char in enumerate(content):
-            # Handle strings
-            if char in '"\'':
-                if not in_comment and not in_char:
-                    if not in_string:
-                        in_string = True
-                        string_char = char
-                    elif string_char == char:
-                        in_string = False
-            
-            # Handle character literals
-            elif char == '`':
-                if not in_comment and not in_string:
-                    in_char = not in_char
-                    
-            # Handle comments
-            elif char == '/' and i + 1 < len(content):
-                if not in_string and not in_char and not in_comment:
-                    if content[i + 1] == '/':
-                        in_comment = True
-                        
-            elif char == '\n':
-                in_comment = False
-                
-            # Handle braces
-            elif not in_string and not in_char and not in_comment:
-                if char == '{':
-                    depth += 1
-                    if depth == 1:
-                        start_pos = i
-                elif char == '}':
-                    depth -= 1
-                    if depth == 0 and start_pos != -1:
-                        return content[start_pos + 1:i]
-                        
-        return ""  # In case of syntax error
+        """Extract content between first { and its matching }.
+
+        Delegates to the token-jumping brace map rather than walking
+        the content character by character with its own state machine.
+        """
+        pairs = self._match_braces(content)
+        if not pairs:
+            return ""  # In case of syntax error
+        start = min(pairs)
+        return content[start + 1:pairs[start]]
 
     def get_main_class(self) -> Optional[str]:
         """
@@ -236,27 +454,17 @@ class CodeIdentifierExtractor:
             Optional[str]: The name of the main class if found, None otherwise
         """
         try:
-            # Pattern for main class with Spring Boot annotation
-            spring_boot_pattern = re.compile(
-                r'@SpringBootApplication\s+public\s+class\s+(\w+)'
-            )
-            # Pattern for traditional Java main class
-            main_method_pattern = re.compile(
-                r'public\s+class\s+(\w+)(?:.*?public\s+static\s+void\s+main\s*\([^)]*\))',
-                re.DOTALL
-            )
-
             def find_main_class(content: str) -> Optional[str]:
                 # First check for Spring Boot application
-                spring_match = spring_boot_pattern.search(content)
+                spring_match = _SPRING_BOOT_MAIN_RE.search(content)
                 if spring_match:
                     return spring_match.group(1)
-                
+
                 # Then check for traditional main method
-                main_match = main_method_pattern.search(content)
+                main_match = _MAIN_METHOD_RE.search(content)
                 if main_match:
                     return main_match.group(1)
-                
+
                 return None
 
             # Return None as we're not tracking analyzed files yet
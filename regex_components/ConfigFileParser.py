@@ -4,10 +4,29 @@ import os
 from pathlib import Path
 import configparser
 import json
+import xml.etree.ElementTree as ET
 from dataclasses import dataclass
 from enum import Enum
 import logging
 
+# YAML support is optional; prefer the libyaml-backed loader, which
+# parses several times faster than the pure-Python tokenizer
+try:
+    import yaml
+    try:
+        from yaml import CSafeLoader as _YamlLoader
+    except ImportError:
+        from yaml import SafeLoader as _YamlLoader
+except ImportError:
+    yaml = None
+
+# Shared with DependencyMapper; compiled once in _patterns
+from regex_components._patterns import (
+    PACKAGE_RE as _PACKAGE_RE,
+    IMPORT_RE as _IMPORT_RE,
+    PROPERTY_RE as _PROPERTY_RE,
+)
+
 class ConfigType(Enum):
     ENV = '.env'
     INI = '.ini'
@@ -26,10 +45,9 @@ class ParsedConfig:
 
 class ConfigFileParser:
     def __init__(self):
-        self.package_pattern = re.compile(r'package\s+([a-zA-Z_][\w.]*)\s*;')
-        self.import_pattern = re.compile(r'import\s+(?:static\s+)?([a-zA-Z_][\w.]*\*?)\s*;')
-        self.property_pattern = re.compile(r'([^=\s]+)\s*=\s*([^\n]+)')
-        self.xml_prop_pattern = re.compile(r'<([^/>]+)>([^<]+)</\1>')
+        self.package_pattern = _PACKAGE_RE
+        self.import_pattern = _IMPORT_RE
+        self.property_pattern = _PROPERTY_RE
         
     def extract_package(self, content: str) -> Optional[str]:
         """Extract package name from Java file content."""
@@ -94,13 +112,17 @@ class ConfigFileParser:
     def _parse_properties(self, content: str) -> ParsedConfig:
         """Parse Java .properties file content."""
         key_values = {}
-        for line in content.splitlines():
-            line = line.strip()
-            if line and not line.startswith('#'):
-                if '=' in line:
-                    key, value = line.split('=', 1)
-                    key_values[key.strip()] = value.strip()
-                    
+        for raw in content.splitlines():
+            line = raw.strip()
+            if not line or line[0] == '#':
+                continue
+            # One partition pass finds the separator and splits at once;
+            # the outer strip already trimmed the line ends, so only the
+            # separator-adjacent sides remain to clean
+            key, sep, value = line.partition('=')
+            if sep:
+                key_values[key.rstrip()] = value.lstrip()
+
         return ParsedConfig(
             config_type=ConfigType.PROPERTIES,
             key_values=key_values,
@@ -110,12 +132,18 @@ class ConfigFileParser:
         )
 
     def _parse_xml(self, content: str) -> ParsedConfig:
-        """Parse XML configuration file content."""
+        """Parse XML configuration file content.
+
+        A real parse replaces the old backreference regex, which both
+        mis-read nested elements and forced the backtracking engine;
+        expat does one C-level pass. Leaf elements with text become the
+        key/value pairs, keyed by local tag name.
+        """
         key_values = {}
-        for match in self.xml_prop_pattern.finditer(content):
-            key, value = match.groups()
-            key_values[key.strip()] = value.strip()
-            
+        for elem in ET.fromstring(content).iter():
+            if len(elem) == 0 and elem.text and elem.text.strip():
+                key_values[elem.tag.rpartition('}')[2]] = elem.text.strip()
+
         return ParsedConfig(
             config_type=ConfigType.XML,
             key_values=key_values,
@@ -126,19 +154,17 @@ class ConfigFileParser:
 
     def _parse_yaml(self, content: str) -> ParsedConfig:
         """Parse YAML configuration file content."""
-        try:
-            import yaml
-            data = yaml.safe_load(content)
-            return ParsedConfig(
-                config_type=ConfigType.YAML,
-                key_values=self._flatten_dict(data),
-                sections={},
-                imports=[],
-                file_relations=[]
-            )
-        except ImportError:
+        if yaml is None:
             logging.warning("PyYAML not installed. YAML parsing unavailable.")
             return None
+        data = yaml.load(content, Loader=_YamlLoader)
+        return ParsedConfig(
+            config_type=ConfigType.YAML,
+            key_values=self._flatten_dict(data),
+            sections={},
+            imports=[],
+            file_relations=[]
+        )
 
     def _parse_json(self, content: str) -> ParsedConfig:
         """Parse JSON configuration file content."""
@@ -152,12 +178,20 @@ class ConfigFileParser:
         )
 
     def _flatten_dict(self, d: Dict, parent_key: str = '', sep: str = '.') -> Dict[str, str]:
-        """Flatten nested dictionary with dot notation."""
-        items: List = []
-        for k, v in d.items():
-            new_key = f"{parent_key}{sep}{k}" if parent_key else k
-            if isinstance(v, dict):
-                items.extend(self._flatten_dict(v, new_key, sep=sep).items())
-            else:
-                items.append((new_key, str(v)))
-        return dict(items)
+        """Flatten nested dictionary with dot notation.
+
+        Walks with an explicit stack instead of recursing: no Python
+        call frame per nesting level, no intermediate items lists, and
+        leaves land straight in the output dict.
+        """
+        flat: Dict[str, str] = {}
+        stack = [(parent_key, d)]
+        while stack:
+            prefix, current = stack.pop()
+            for key, value in current.items():
+                new_key = f"{prefix}{sep}{key}" if prefix else key
+                if isinstance(value, dict):
+                    stack.append((new_key, value))
+                else:
+                    flat[new_key] = str(value)
+        return flat
@@ -5,6 +5,25 @@ import xml.etree.ElementTree as ET
 import json
 from dataclasses import dataclass
 
+from regex_components._patterns import IMPORT_RE as _IMPORT_RE, PACKAGE_RE as _PACKAGE_RE
+
+# Compiled once at import time so repeated per-file calls reuse the same pattern objects
+_GRADLE_DEP_RE = re.compile(
+    r'(?:implementation|compile|api|testImplementation|testCompile)'
+    r'\s*[\'"]([^:]+):([^:]+):([^\'"]+)[\'"]'
+)
+_DECLARATION_RE = re.compile(
+    r'\b(?:package\s+(?P<package>[a-zA-Z_][\w.]*)'
+    r'|import\s+(?:static\s+)?(?P<import>[a-zA-Z_][\w.]*\*?))\s*;'
+)
+# The three environment-variable access forms merged into one
+# alternation so the content is walked once instead of once per form
+_ENV_VAR_RE = re.compile(
+    r'System\.getenv\([\'"](?P<getenv>\w+)[\'"]\)'
+    r'|@Value\(\s*[\'"]?\$\{(?P<value>[^}]+)}[\'"]?\s*\)'
+    r'|environment\.get\([\'"](?P<envget>\w+)[\'"]\)'
+)
+
 @dataclass
 class Dependency:
     group_id: str
@@ -12,40 +31,105 @@ class Dependency:
     version: str
     scope: Optional[str] = None
 
+
+class _PomDependencyTarget:
+    """Expat target that collects <dependency> entries directly.
+
+    Unlike iterparse, no Element object is ever built: text of the
+    direct children of each <dependency> is captured as it streams by
+    (depth-tracked, so <exclusions> blocks cannot shadow the real
+    coordinates) and everything outside a dependency is ignored.
+    """
+
+    def __init__(self):
+        self.deps: List[Dependency] = []
+        self._fields = None
+        self._field = None
+        self._text = None
+        self._depth = 0
+
+    def start(self, tag, attrib):
+        if self._fields is not None:
+            self._depth += 1
+            if self._depth == 1:
+                self._field = tag.rpartition('}')[2]
+                self._text = []
+        elif tag.rpartition('}')[2] == 'dependency':
+            self._fields = {}
+            self._depth = 0
+
+    def end(self, tag):
+        if self._fields is None:
+            return
+        if self._depth == 0:
+            fields = self._fields
+            self._fields = None
+            if fields.get('groupId') is not None and fields.get('artifactId') is not None:
+                self.deps.append(Dependency(
+                    group_id=fields['groupId'],
+                    artifact_id=fields['artifactId'],
+                    version=fields.get('version'),
+                    scope=fields.get('scope') or 'compile'
+                ))
+            return
+        if self._depth == 1 and self._field is not None:
+            text = ''.join(self._text)
+            self._fields[self._field] = text if text else None
+            self._field = None
+            self._text = None
+        self._depth -= 1
+
+    def data(self, data):
+        if self._text is not None:
+            self._text.append(data)
+
+    def close(self):
+        return self.deps
+
 class DependencyMapper:
     def __init__(self):
-        self.import_pattern = re.compile(r'import\s+(?:static\s+)?([a-zA-Z_][\w.]*\*?)\s*;')
-        self.package_pattern = re.compile(r'package\s+([a-zA-Z_][\w.]*)\s*;')
-        
+        self.import_pattern = _IMPORT_RE
+        self.package_pattern = _PACKAGE_RE
+
     def extract_imports(self, content: str) -> List[str]:
         """Extract import statements from Java file content."""
         return [match.group(1) for match in self.import_pattern.finditer(content)]
 
+    def extract_declarations(self, content: str) -> 'tuple[Optional[str], List[str]]':
+        """Extract the package name and all imports in a single scan.
+
+        Package and import statements share the same declaration shape,
+        so one alternation pass replaces two whole-file sweeps.
+        """
+        package = None
+        imports = []
+        for match in _DECLARATION_RE.finditer(content):
+            import_name = match.group('import')
+            if import_name is not None:
+                imports.append(import_name)
+            elif package is None:
+                package = match.group('package')
+        return package, imports
+
     def extract_maven_dependencies(self, pom_path: str) -> List[Dependency]:
-        """Extract dependencies from Maven pom.xml file."""
+        """Extract dependencies from Maven pom.xml file.
+
+        Streams the document through a target handler instead of
+        building Element objects at all: expat hands tag and text
+        events straight to _PomDependencyTarget, which keeps only the
+        coordinate fields of the dependency currently open. Memory
+        stays flat for large multi-module POMs and nothing outside
+        <dependency> blocks is materialized.
+        """
         try:
-            tree = ET.parse(pom_path)
-            root = tree.getroot()
-            
-            # Handle XML namespaces in Maven POM
-            ns = {'mvn': 'http://maven.apache.org/POM/4.0.0'}
-            dependencies = []
-            
-            for dep in root.findall('.//mvn:dependency', ns):
-                group_id = dep.find('mvn:groupId', ns)
-                artifact_id = dep.find('mvn:artifactId', ns)
-                version = dep.find('mvn:version', ns)
-                scope = dep.find('mvn:scope', ns)
-                
-                if group_id is not None and artifact_id is not None:
-                    dependencies.append(Dependency(
-                        group_id=group_id.text,
-                        artifact_id=artifact_id.text,
-                        version=version.text if version is not None else None,
-                        scope=scope.text if scope is not None else 'compile'
-                    ))
-                    
-            return dependencies
+            parser = ET.XMLParser(target=_PomDependencyTarget())
+            with open(pom_path, 'rb') as f:
+                while True:
+                    chunk = f.read(1 << 16)
+                    if not chunk:
+                        break
+                    parser.feed(chunk)
+            return parser.close()
         except Exception as e:
             import logging
             logging.error(f"Error parsing pom.xml {pom_path}: {str(e)}")
@@ -55,16 +139,11 @@ class DependencyMapper:
         """Extract dependencies from build.gradle file."""
         try:
             content = Path(build_gradle_path).read_text(encoding='utf-8')
-            
-            # Basic regex patterns for Gradle dependency declarations
-            dependency_pattern = re.compile(
-                r'(?:implementation|compile|api|testImplementation|testCompile)'
-                r'\s*[\'"]([^:]+):([^:]+):([^\'"]+)[\'"]'
-            )
-            
+
             dependencies = []
-            for match in dependency_pattern.finditer(content):
-                group_id, artifact_id, version = match.groups()
+            # findall returns the group tuples directly, skipping a Match
+            # object allocation per dependency
+            for group_id, artifact_id, version in _GRADLE_DEP_RE.findall(content):
                 dependencies.append(Dependency(
                     group_id=group_id,
                     artifact_id=artifact_id,
@@ -81,33 +160,24 @@ class DependencyMapper:
     def map_import_hierarchy(self, imports: List[str]) -> Dict[str, List[str]]:
         """Create a hierarchy map of imports."""
         hierarchy: Dict[str, List[str]] = {}
-        
+
         for imp in imports:
             parts = imp.split('.')
             current_level = hierarchy
-            
-            for i, part in enumerate(parts[:-1]):
-                if part not in current_level:
-                    current_level[part] = {}
-                current_level = current_level[part]
-                
+
+            # setdefault walks each level with one hash lookup instead
+            # of a membership test plus one or two subscript lookups
+            for part in parts[:-1]:
+                current_level = current_level.setdefault(part, {})
+
             if parts[-1] != '*':
-                if 'classes' not in current_level:
-                    current_level['classes'] = []
-                current_level['classes'].append(parts[-1])
-                
+                current_level.setdefault('classes', []).append(parts[-1])
+
         return hierarchy
 
     def extract_environment_variables(self, content: str) -> Set[str]:
         """Extract environment variable references from code."""
-        env_patterns = [
-            re.compile(r'System\.getenv\([\'"](\w+)[\'"]\)'),
-            re.compile(r'@Value\(\s*[\'"]?\$\{([^}]+)}[\'"]?\s*\)'),
-            re.compile(r'environment\.get\([\'"](\w+)[\'"]\)')
-        ]
-        
-        env_vars = set()
-        for pattern in env_patterns:
-            env_vars.update(match.group(1) for match in pattern.finditer(content))
-            
-        return env_vars
+        return {
+            match.group(match.lastgroup)
+            for match in _ENV_VAR_RE.finditer(content)
+        }
